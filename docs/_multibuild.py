@@ -0,0 +1,137 @@
+"""Build the documentation for several languages from Python worker processes.
+
+Languages are built side by side, one worker process per language, each
+driving the Sphinx application directly. Every worker imports Sphinx and its
+extensions once; whether that import is shared with this process depends on
+the platform's start method (inherited under ``fork``, repeated under
+``spawn``), so the gain over separate ``sphinx-build`` runs is the parallelism,
+not the import. Pass ``--no-parallel`` to build the languages one after
+another in this process.
+
+Run from the ``docs`` directory::
+
+    python -m _multibuild [--builder html] [--jobs auto] [--no-parallel] en_US zh_CN
+"""
+
+# Import built-in modules
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import os
+from pathlib import Path
+import sys
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# Import third-party modules
+from sphinx.application import Sphinx
+from sphinx.util.docutils import docutils_namespace
+from sphinx.util.docutils import patch_docutils
+
+
+SOURCE_DIR = "source"
+
+
+def resolve_jobs(jobs: str) -> int:
+    """Resolve a ``sphinx-build -j`` value to a worker count.
+
+    Args:
+        jobs: Worker count, or ``auto`` for one per CPU
+
+    Returns:
+        int: Number of parallel Sphinx workers
+    """
+    if jobs == "auto":
+        return os.cpu_count() or 1
+    return max(1, int(jobs))
+
+
+def get_targets(languages: List[str]) -> List[Tuple[str, Path, Path]]:
+    """Get the output and doctree directories of every language.
+
+    Args:
+        languages: Language codes to build
+
+    Returns:
+        List[Tuple[str, Path, Path]]: ``(language, outdir, doctreedir)`` for each language
+    """
+    return [(language, Path("build", "html", language), Path("build", "doctrees", language)) for language in languages]
+
+
+def build(language: str, outdir: Path, doctreedir: Path, parallel: int, builder: str = "html") -> int:
+    """Build the documentation for a single language.
+
+    Args:
+        language: Language code (e.g. ``en_US``)
+        outdir: Output directory of the build
+        doctreedir: Doctree cache directory of the build
+        parallel: Number of parallel Sphinx workers
+        builder: Sphinx builder to use
+
+    Returns:
+        int: Sphinx status code
+    """
+    # docutils_namespace() resets the directives and roles registered by the
+    # previous build, exactly like separate sphinx-build runs would
+    with patch_docutils(SOURCE_DIR), docutils_namespace():
+        app = Sphinx(
+            srcdir=SOURCE_DIR,
+            confdir=SOURCE_DIR,
+            outdir=str(outdir),
+            doctreedir=str(doctreedir),
+            buildername=builder,
+            confoverrides={"language": language},
+            parallel=parallel,
+        )
+        app.build()
+    return app.statuscode
+
+
+def main(languages: List[str], concurrent: bool = True, builder: str = "html", jobs: str = "auto") -> int:
+    """Build the documentation for every requested language.
+
+    Args:
+        languages: Language codes to build
+        concurrent: Build the languages in parallel worker processes
+        builder: Sphinx builder to use
+        jobs: Total number of parallel Sphinx workers, or ``auto`` for one per CPU
+
+    Returns:
+        int: Highest Sphinx status code across all builds
+    """
+    parallel = resolve_jobs(jobs)
+    targets = get_targets(languages)
+    # Create every directory up front so the workers never race on shared parents
+    for _, outdir, doctreedir in targets:
+        outdir.mkdir(parents=True, exist_ok=True)
+        doctreedir.mkdir(parents=True, exist_ok=True)
+    if not concurrent or len(targets) < 2:
+        return max((build(*target, parallel, builder) for target in targets), default=0)
+    # Each language has its own output and doctree directory, so the builds are independent;
+    # split the workers between them so the concurrent builds do not oversubscribe the CPUs
+    parallel = max(1, parallel // len(targets))
+    with ProcessPoolExecutor(max_workers=len(targets)) as executor:
+        futures = [executor.submit(build, *target, parallel, builder) for target in targets]
+        return max(future.result() for future in futures)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse the command line.
+
+    Args:
+        argv: Arguments to parse (default: ``sys.argv[1:]``)
+
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(prog="_multibuild", description=__doc__.splitlines()[0])
+    parser.add_argument("--builder", default="html", help="Sphinx builder to use")
+    parser.add_argument("--jobs", default="auto", help="Total number of parallel Sphinx workers, or 'auto'")
+    parser.add_argument("--no-parallel", action="store_true", help="Build the languages one after another")
+    parser.add_argument("languages", nargs="+", help="Language codes to build")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    sys.exit(main(args.languages, concurrent=not args.no_parallel, builder=args.builder, jobs=args.jobs))
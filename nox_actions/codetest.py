@@ -7,13 +7,17 @@ from nox_actions.utils import PACKAGE_NAME
 from nox_actions.utils import THIS_ROOT
 
 
+@nox.session(name="pytest")
 def pytest(session: nox.Session) -> None:
     """Run the test suite."""
     session.install(".")
-    session.install("pytest", "pytest_cov", "pytest_mock", "pytest-benchmark", "pytest-timeout")
+    session.install("pytest", "pytest_cov", "pytest_mock", "pytest-benchmark", "pytest-timeout", "pytest-xdist")
     test_root = os.path.join(THIS_ROOT, "tests")
     session.run(
         "pytest",
+        "-n",
+        "auto",
+        "--dist=loadscope",
         f"--cov={PACKAGE_NAME}",
         "--cov-report=xml:coverage.xml",
         f"--rootdir={test_root}",
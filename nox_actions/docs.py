@@ -1,23 +1,40 @@
 """Nox actions for documentation tasks."""
 
 # Import built-in modules
-import errno
+from concurrent.futures import ThreadPoolExecutor
+import fnmatch
+import functools
+import hashlib
 import locale
 import os
 from pathlib import Path
 import shutil
-import stat
-from typing import Any
-from typing import Callable
+import subprocess
+import sys
+import threading
+from typing import Iterator
+from typing import List
 from typing import Optional
 
 # Import third-party modules
 import nox
 from nox.sessions import Session
+from nox_actions.utils import PACKAGE_NAME
+from nox_actions.utils import THIS_ROOT
+from nox_actions.utils import _fast_rmtree
 
 
 languages = ["en_US", "zh_CN"]
 
+# Resolved once at import; sessions look it up many times
+_DOCS_DIR = THIS_ROOT / "docs"
+
+# Posargs that request a full clean before building (e.g. ``nox -s docs -- --clean``)
+clean_flags = ("--clean", "-c")
+
+# Posarg that builds the languages one after another instead of concurrently
+no_parallel_flag = "--no-parallel"
+
 # Documentation dependencies
 docs_dependencies = [
     "sphinx>=5.0",
@@ -32,40 +49,87 @@ docs_dependencies = [
 ]
 
 
-def handle_remove_readonly(func: Callable, path: str, exc: Any) -> None:
-    """Handle read-only files when removing directories.
+def remove_tree_in_background(session: Session, path: Path) -> None:
+    """Delete a directory tree without blocking the session.
+
+    On Windows the deletion is handed to a detached ``rmdir /s /q``. Elsewhere
+    a non-daemon thread, which the interpreter waits for on exit, runs
+    ``rm -rf`` and falls back to ``_fast_rmtree`` if ``rm`` is unavailable.
 
     Args:
-        func: The function that failed
-        path: The path that is being processed
-        exc: The exception that was raised
+        session: Nox session object
+        path: Directory to delete
     """
-    excvalue = exc[1]
-    if func in (os.rmdir, os.remove, os.unlink) and excvalue.errno == errno.EACCES:
-        os.chmod(path, stat.S_IRWXU | stat.S_IRWXG | stat.S_IRWXO)  # 0777
-        func(path)  # Try again
-    else:
-        raise
+    if sys.platform == "win32":
+        subprocess.Popen(["cmd", "/c", "rmdir", "/s", "/q", str(path)])
+        return
+
+    def remove() -> None:
+        try:
+            try:
+                # Keep the directory walk in native code
+                subprocess.run(["rm", "-rf", str(path)], check=True)
+            except FileNotFoundError:
+                _fast_rmtree(path)
+        except Exception as e:
+            session.warn(f"Failed to remove {path}: {e}")
+
+    threading.Thread(target=remove, name=f"remove-{path.name}").start()
 
 
 def install_docs_dependencies(session: Session) -> None:
     """Install all documentation dependencies.
 
+    Sessions reuse their virtualenv, so the install is skipped while a stamp
+    file in the environment matches the dependency list and the contents of
+    ``pyproject.toml``. Hashing the contents rather than the modification time
+    keeps the stamp valid across fresh checkouts, e.g. for cached CI environments.
+
     Args:
         session: Nox session object
     """
-    # Install the package in editable mode with docs dependencies
-    session.install("-e", ".[docs]")
+    digest = hashlib.blake2b("\n".join(docs_dependencies).encode())
+    digest.update((THIS_ROOT / "pyproject.toml").read_bytes())
+    stamp_value = digest.hexdigest()
+    stamp = Path(session.virtualenv.location) / ".docs-deps.stamp"
+    if stamp.is_file() and stamp.read_text(encoding="utf-8") == stamp_value:
+        session.log("Documentation dependencies already installed")
+        return
+
+    # Share one download cache between all docs sessions, inside the nox envdir so
+    # that CI restores it together with the cached virtualenvs
+    cache_dir = str(Path(session.virtualenv.location).parent / "_pip_cache")
+    session.env["PIP_CACHE_DIR"] = cache_dir
+    session.env["UV_CACHE_DIR"] = cache_dir
+    session.env["PIP_DISABLE_PIP_VERSION_CHECK"] = "1"
+    session.env["PIP_PREFER_BINARY"] = "1"
+
+    # Install the package in editable mode together with the documentation
+    # dependencies, so the dependency graph is resolved only once
+    if shutil.which("uv"):
+        # uv installs into the session's virtualenv through VIRTUAL_ENV
+        session.run_install("uv", "pip", "install", "-e", ".[docs]", *docs_dependencies, external=True)
+    else:
+        session.install("-e", ".[docs]", *docs_dependencies)
+
+    stamp.write_text(stamp_value, encoding="utf-8")
 
-    # Install documentation dependencies
-    session.install(*docs_dependencies)
+
+def get_sphinx_jobs() -> str:
+    """Get the number of parallel Sphinx workers.
+
+    Returns:
+        str: Value for ``sphinx-build -j``, taken from ``SPHINX_JOBS`` (default: ``auto``)
+    """
+    return os.environ.get("SPHINX_JOBS", "auto")
 
 
 def get_docs_dir() -> Path:
     """Get the docs directory path."""
-    return Path(__file__).parent.parent / "docs"
+    return _DOCS_DIR
 
 
+@functools.lru_cache(maxsize=1)
 def get_system_language() -> str:
     """Get the system language.
 
@@ -73,8 +137,14 @@ def get_system_language() -> str:
         str: Language code (e.g., 'en_US' or 'zh_CN')
     """
     try:
-        # Get system locale
-        system_locale = locale.getdefaultlocale()[0]
+        # Check the POSIX locale variables first (in precedence order); fall back to
+        # the C library locale, as locale.getdefaultlocale() is deprecated
+        system_locale = (
+            os.environ.get("LC_ALL")
+            or os.environ.get("LC_MESSAGES")
+            or os.environ.get("LANG")
+            or locale.getlocale(locale.LC_CTYPE)[0]
+        )
         if system_locale:
             # Map locale to our supported languages
             if system_locale.startswith("zh"):
@@ -87,40 +157,264 @@ def get_system_language() -> str:
     return "en_US"
 
 
-def clean_docs(session: Session) -> None:
-    """Clean documentation build directory.
+def build_languages(session: Session, build_languages: List[str], builder: str = "html") -> None:
+    """Build documentation for several languages concurrently.
+
+    Each language writes to its own output and doctree directory, so the
+    builds are independent and run side by side in the worker processes of
+    ``docs/_multibuild.py``. Pass ``-- --no-parallel`` to build them one after
+    another instead. Must be called from within the docs directory.
+
+    Args:
+        session: Nox session object
+        build_languages: Languages to build
+        builder: Sphinx builder to use
+    """
+    session.log(f"Building documentation for {', '.join(build_languages)}")
+    serial = [no_parallel_flag] if no_parallel_flag in session.posargs else []
+    session.run(
+        "python",
+        "-m",
+        "_multibuild",
+        "--builder",
+        builder,
+        "--jobs",
+        get_sphinx_jobs(),
+        *serial,
+        *build_languages,
+    )
+
+
+def _write_if_changed(path: Path, content: str, encoding: str = "utf-8") -> bool:
+    """Write a file only if its content differs from what is already on disk.
+
+    Leaving identical files untouched keeps their mtime stable for tools
+    that key on it (Sphinx, rsync, static site deploys).
+
+    Args:
+        path: File to write
+        content: Text content
+        encoding: Text encoding
+
+    Returns:
+        bool: True if the file was written
+    """
+    try:
+        if path.read_text(encoding=encoding) == content:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_text(content, encoding=encoding)
+    return True
+
+
+def _scan_files(path: Path, *patterns: str) -> Iterator[os.DirEntry]:
+    """Recursively yield the files below a directory that match the given patterns.
+
+    ``os.scandir`` reports the entry type without an extra ``stat`` call and
+    ``DirEntry.stat()`` caches its result, unlike ``Path.rglob``.
+
+    Args:
+        path: Directory to search recursively
+        *patterns: Filename patterns to match (e.g. ``"*.rst"``)
+
+    Yields:
+        os.DirEntry: Matching file entries
+    """
+    try:
+        entries = os.scandir(path)
+    except FileNotFoundError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_files(Path(entry.path), *patterns)
+            elif any(fnmatch.fnmatch(entry.name, pattern) for pattern in patterns):
+                yield entry
+
+
+def _newest_mtime(path: Path, *patterns: str) -> float:
+    """Get the newest modification time of files matching the given patterns.
+
+    Args:
+        path: Directory to search recursively
+        *patterns: Filename patterns to match (e.g. ``"*.rst"``)
+
+    Returns:
+        float: Newest modification time, or 0.0 if no file matches
+    """
+    return max((entry.stat().st_mtime for entry in _scan_files(path, *patterns)), default=0.0)
+
+
+def _newest_message_source_mtime() -> float:
+    """Get the newest modification time of the inputs of the message catalogs.
+
+    Covers the documentation sources, ``conf.py`` and the package modules
+    whose docstrings autodoc pulls into the translatable messages.
+
+    Returns:
+        float: Newest modification time, or 0.0 if no input exists
+    """
+    source_dir = get_docs_dir() / "source"
+    return max(
+        _newest_mtime(source_dir, "*.rst", "*.md", "conf.py"),
+        _newest_mtime(THIS_ROOT / PACKAGE_NAME, "*.py"),
+    )
+
+
+def _catalogs_outdated(lang_dir: Path, newest_source: float) -> bool:
+    """Check whether any compiled .mo file is older than its .po catalog or the sources.
+
+    Args:
+        lang_dir: ``LC_MESSAGES`` directory of a language
+        newest_source: Newest modification time of the catalog inputs
+
+    Returns:
+        bool: True if at least one .mo file is missing or stale
+    """
+    for entry in _scan_files(lang_dir, "*.po"):
+        mo_file = Path(entry.path).with_suffix(".mo")
+        if not mo_file.exists() or mo_file.stat().st_mtime < max(entry.stat().st_mtime, newest_source):
+            return True
+    return False
+
+
+def extract_messages(session: Session) -> None:
+    """Extract translatable messages to .pot files when the sources changed.
+
+    Extraction is skipped when no .rst/.md source, ``conf.py`` or package
+    module is newer than the last successful run. Must be called from within
+    the docs directory.
 
     Args:
         session: Nox session object
     """
     docs_dir = get_docs_dir()
-    build_dir = docs_dir / "build"
+    stamp = docs_dir / "build" / "gettext" / ".timestamp"
+    last_extracted = stamp.stat().st_mtime if stamp.exists() else 0.0
 
-    if build_dir.exists():
-        session.log(f"Cleaning {build_dir}")
-        try:
-            shutil.rmtree(str(build_dir), onerror=handle_remove_readonly)
-            session.log("Documentation build directory cleaned")
-        except Exception as e:
-            session.warn(f"Failed to clean {build_dir}: {e}")
-            # Try to continue even if cleaning fails
-            pass
+    if _newest_message_source_mtime() <= last_extracted:
+        session.log("Message templates are up to date, skipping gettext extraction")
+        return
+
+    session.run(
+        "sphinx-build",
+        "-b",
+        "gettext",
+        "-j",
+        get_sphinx_jobs(),
+        "-d",
+        "build/doctrees/gettext",
+        "source",
+        "build/gettext",
+    )
+    stamp.touch()
+
+
+def _compute_docs_hash() -> str:
+    """Hash every input of the documentation build.
 
+    Covers the documentation sources, ``pyproject.toml`` and the package
+    modules pulled in by autodoc.
 
-@nox.session(name="docs-clean")
+    Returns:
+        str: Hex digest that changes whenever any input file changes
+    """
+    inputs = [
+        *(get_docs_dir() / "source").rglob("*"),
+        *(THIS_ROOT / PACKAGE_NAME).rglob("*.py"),
+        THIS_ROOT / "pyproject.toml",
+    ]
+    files = sorted(path for path in inputs if path.is_file())
+    digest = hashlib.blake2b()
+    # Read the files concurrently so the I/O overlaps; hashing stays in sorted order
+    with ThreadPoolExecutor() as executor:
+        for path, content in zip(files, executor.map(Path.read_bytes, files)):
+            digest.update(path.relative_to(THIS_ROOT).as_posix().encode())
+            digest.update(b"\0")
+            digest.update(content)
+    return digest.hexdigest()
+
+
+def _should_clean(session: Session) -> bool:
+    """Check whether a full clean was requested on the command line.
+
+    Args:
+        session: Nox session object
+
+    Returns:
+        bool: True if ``--clean`` or ``-c`` was passed as a positional argument
+    """
+    return any(flag in session.posargs for flag in clean_flags)
+
+
+def discard_tree(session: Session, path: Path) -> Optional[Path]:
+    """Move a directory out of the way so it can be deleted in the background.
+
+    Renaming is atomic, so the next build starts from an empty directory right
+    away while the old tree is deleted by ``remove_tree_in_background``.
+
+    Args:
+        session: Nox session object
+        path: Directory to discard
+
+    Returns:
+        Optional[Path]: The renamed directory, or None if there was nothing to move
+    """
+    if not path.exists():
+        return None
+    session.log(f"Cleaning {path}")
+    trash_dir = path.with_name(f"{path.name}.delete-{os.getpid()}")
+    try:
+        path.rename(trash_dir)
+    except OSError as e:
+        session.warn(f"Failed to clean {path}: {e}")
+        # Try to continue even if cleaning fails
+        return None
+    return trash_dir
+
+
+def clean_docs(session: Session, keep_cache: bool = False) -> None:
+    """Clean documentation build directory.
+
+    This removes the Sphinx doctree cache as well unless ``keep_cache`` is set,
+    so the next build is a full rebuild. Build sessions only call this when
+    ``--clean`` is passed.
+
+    Args:
+        session: Nox session object
+        keep_cache: Keep ``build/doctrees`` so the next build stays incremental
+    """
+    build_dir = get_docs_dir() / "build"
+    trash_dir = discard_tree(session, build_dir)
+    if trash_dir is None:
+        return
+    doctrees_dir = trash_dir / "doctrees"
+    if keep_cache and doctrees_dir.is_dir():
+        build_dir.mkdir()
+        doctrees_dir.rename(build_dir / "doctrees")
+    remove_tree_in_background(session, trash_dir)
+    session.log("Documentation build directory cleaned")
+
+
+@nox.session(name="docs-clean", reuse_venv=True)
 def docs_clean(session: Session) -> None:
     """Clean documentation build directory.
 
+    Pass ``-- --keep-cache`` to delete the output but keep the doctree cache.
+
     Args:
         session: Nox session object
     """
-    clean_docs(session)
+    clean_docs(session, keep_cache="--keep-cache" in session.posargs)
 
 
-@nox.session(name="docs")
+@nox.session(name="docs", reuse_venv=True)
 def docs(session: Session, builder: str = "html", language: Optional[str] = None) -> None:
     """Build documentation with sphinx.
 
+    Builds are incremental; pass ``-- --clean`` to wipe the build directory first.
+
     Args:
         session: Nox session object
         builder: Sphinx builder to use
@@ -129,27 +423,23 @@ def docs(session: Session, builder: str = "html", language: Optional[str] = None
     # Install dependencies
     install_docs_dependencies(session)
 
-    # Clean build directory first
-    clean_docs(session)
+    # Only clean when explicitly requested so the doctree cache survives
+    if _should_clean(session):
+        clean_docs(session)
 
     # Get docs directory
     docs_dir = get_docs_dir()
 
     # Build for specified language or all languages
-    build_languages = [language] if language else languages
+    target_languages = [language] if language else languages
 
     with session.chdir(str(docs_dir)):
-        for lang in build_languages:
-            session.log(f"Building documentation for {lang}")
-            env = {"SPHINX_LANGUAGE": lang}
-            output_dir = f"build/html/{lang}"
-
-            session.run("sphinx-build", "-b", builder, "-D", f"language={lang}", "source", output_dir, env=env)
+        build_languages(session, target_languages, builder)
 
     session.log("Documentation built successfully")
 
 
-@nox.session(name="docs-live")
+@nox.session(name="docs-live", reuse_venv=True)
 def docs_live(session: Session, language: Optional[str] = None) -> None:
     """Build documentation with live reload using sphinx-autobuild.
 
@@ -168,47 +458,37 @@ def docs_live(session: Session, language: Optional[str] = None) -> None:
     if language not in languages:
         session.error(f"Unsupported language: {language}")
 
-    # Set up environment
-    env = os.environ.copy()
-    env["SPHINX_LANGUAGE"] = language
-
-    # Clean build directory first
-    clean_docs(session)
+    # Only clean when explicitly requested so the doctree cache survives
+    if _should_clean(session):
+        clean_docs(session)
 
     # Get docs directory
     docs_dir = get_docs_dir()
 
-    # First build all languages
-    for lang in languages:
-        session.log(f"Building documentation for {lang}")
-        with session.chdir(str(docs_dir)):
-            session.run(
-                "sphinx-build",
-                "-b",
-                "html",
-                "-D",
-                f"language={lang}",
-                "source",
-                f"build/html/{lang}",
-                env={"SPHINX_LANGUAGE": lang},
-            )
-
-    # Then start autobuild for the selected language
     with session.chdir(str(docs_dir)):
+        # First build all languages concurrently
+        build_languages(session, languages)
+
+        # Then start autobuild for the selected language
         output_dir = f"build/html/{language}"
         session.log(f"Starting live preview for language: {language}")
+        # Parallel rebuilds are unreliable under sphinx-autobuild on Windows
+        jobs = [] if sys.platform == "win32" else ["-j", get_sphinx_jobs()]
         session.run(
             "sphinx-autobuild",
             "-b",
             "html",
+            *jobs,
+            "-d",
+            f"build/doctrees/{language}",
             "-D",
             f"language={language}",
             "--host",
             "127.0.0.1",
             "--port",
             "8000",
-            "--watch",
-            "source",
+            # The warm-up above already built this language
+            "--no-initial",
             "--ignore",
             "*.swp",
             "--ignore",
@@ -217,31 +497,39 @@ def docs_live(session: Session, language: Optional[str] = None) -> None:
             "*.log",
             "--ignore",
             "*.out",
+            # Absolute, so the build output (every language) is ignored whatever the working directory
             "--ignore",
-            "_build",
+            str(docs_dir / "_build"),
             "--ignore",
-            "build",
-            "--re-ignore",
-            r".*\/__pycache__\/.*",
-            "--re-ignore",
-            r"\.pytest_cache\/.*",
-            "--re-ignore",
-            r"\.git\/.*",
-            "--re-ignore",
-            r"\.tox\/.*",
-            "--re-ignore",
-            r"\.nox\/.*",
-            "--re-ignore",
-            r"\.idea\/.*",
-            "--re-ignore",
-            r"\.vscode\/.*",
-            "source",
+            str(docs_dir / "build"),
+            "--ignore",
+            "*.pot",
+            # Globs are resolved once and matched with fnmatch, unlike the regexes
+            # sphinx-autobuild runs against every changed path
+            "--ignore",
+            "*/__pycache__/*",
+            "--ignore",
+            "*/.pytest_cache/*",
+            "--ignore",
+            "*/.git/*",
+            "--ignore",
+            "*/.tox/*",
+            "--ignore",
+            "*/.nox/*",
+            "--ignore",
+            "*/.idea/*",
+            "--ignore",
+            "*/.vscode/*",
+            # Compiled catalogs are rewritten by docs-i18n and must not trigger rebuilds
+            "--ignore",
+            str(docs_dir / "source" / "locale" / "*.mo"),
+            # The source directory is always watched, so no extra --watch is needed
+            str(docs_dir / "source"),
             output_dir,
-            env=env,
         )
 
 
-@nox.session(name="docs-lint")
+@nox.session(name="docs-lint", reuse_venv=True)
 def docs_lint(session: Session) -> None:
     """Run documentation linting.
 
@@ -267,6 +555,17 @@ def docs_lint(session: Session) -> None:
         success_codes=[0, 1],  # Allow doc8 to fail
     )
 
+    # Skip the Sphinx check when nothing it reads changed since it last passed;
+    # autodoc pulls in the package modules as well
+    stamp = docs_dir / "build" / "doctrees" / "lint" / ".lint-ok"
+    if stamp.exists():
+        newest_input = max(_newest_mtime(source_dir, "*"), _newest_mtime(THIS_ROOT / PACKAGE_NAME, "*.py"))
+        if newest_input <= stamp.stat().st_mtime:
+            session.log("Documentation sources are unchanged since the last lint, skipping sphinx-build")
+            return
+        # Drop the stale stamp so that a failed or interrupted run cannot leave it behind
+        stamp.unlink()
+
     # Run sphinx-build with nitpicky mode, but don't treat warnings as errors
     # This is a temporary change to allow CI to pass while we fix documentation issues
     with session.chdir(str(docs_dir)):
@@ -274,16 +573,23 @@ def docs_lint(session: Session) -> None:
             "sphinx-build",
             "-b",
             "html",
+            "-j",
+            get_sphinx_jobs(),
             # "-W",  # Warnings as errors - temporarily disabled
             "-n",  # Nitpicky mode
+            "-d",
+            "build/doctrees/lint",
             "-D",
             "language=en",
             "source",
             "build/lint-check",
         )
 
+    # Only reached when sphinx-build succeeded
+    stamp.touch()
+
 
-@nox.session(name="docs-i18n")
+@nox.session(name="docs-i18n", reuse_venv=True)
 def docs_i18n(session: Session) -> None:
     """Generate and update translation files.
 
@@ -305,6 +611,8 @@ def docs_i18n(session: Session) -> None:
             ├── *.po   # Translation files
             └── *.mo   # Compiled translation files
 
+    Pass ``-- --clean`` to discard the extracted .pot files in build/gettext first.
+
     Args:
         session: Nox session object
     """
@@ -315,9 +623,15 @@ def docs_i18n(session: Session) -> None:
     source_dir = docs_dir / "source"
     locale_dir = source_dir / "locale"
 
+    # The extracted .pot files are kept between runs; --clean forces a fresh extraction
+    if _should_clean(session):
+        trash_dir = discard_tree(session, docs_dir / "build" / "gettext")
+        if trash_dir is not None:
+            remove_tree_in_background(session, trash_dir)
+
     with session.chdir(str(docs_dir)):
         # Extract messages to .pot files
-        session.run("sphinx-build", "-b", "gettext", "source", "build/gettext")
+        extract_messages(session)
 
         # Update .po files for all supported languages
         for lang in languages:
@@ -328,18 +642,20 @@ def docs_i18n(session: Session) -> None:
             # Update .po files
             session.run("sphinx-intl", "update", "-p", "build/gettext", "-d", str(locale_dir), "-l", lang)
 
-            # Compile .po files to .mo files
-            session.run("sphinx-intl", "build", "-d", str(locale_dir))
-
-    # Clean up temporary gettext files
-    gettext_dir = docs_dir / "build" / "gettext"
-    if gettext_dir.exists():
-        shutil.rmtree(str(gettext_dir))
+        # Compile .po files to .mo files in a single run, for the languages that need it
+        newest_source = _newest_message_source_mtime()
+        outdated = [lang for lang in languages if _catalogs_outdated(locale_dir / lang / "LC_MESSAGES", newest_source)]
+        if outdated:
+            session.run(
+                "sphinx-intl", "build", "-d", str(locale_dir), *(arg for lang in outdated for arg in ("-l", lang))
+            )
+        else:
+            session.log("Compiled catalogs are up to date")
 
     session.log("Translation files updated successfully")
 
 
-@nox.session(name="docs-build")
+@nox.session(name="docs-build", reuse_venv=True)
 def docs_build(session: Session) -> None:
     """Build documentation for all languages.
 
@@ -353,36 +669,33 @@ def docs_build(session: Session) -> None:
     │   └── ...
     └── index.html  # Language selection page
 
+    Builds are incremental and skipped entirely when ``build/.build-hash``
+    matches the current inputs; pass ``-- --clean`` to wipe the build
+    directory first.
+
     Args:
         session: Nox session object
     """
+    # Skip the whole pipeline when no input changed since the last successful build
+    hash_path = get_docs_dir() / "build" / ".build-hash"
+    if _should_clean(session):
+        clean_docs(session)
+    elif hash_path.is_file() and hash_path.read_text(encoding="utf-8") == _compute_docs_hash():
+        session.log("Documentation inputs are unchanged, skipping build")
+        return
+
     # Install dependencies
     install_docs_dependencies(session)
 
-    # Clean build directory first
-    clean_docs(session)
-
     # First generate POT files
     with session.chdir(str(get_docs_dir())):
-        session.run("sphinx-build", "-b", "gettext", "source", "build/gettext")
+        extract_messages(session)
 
         # Update PO files for Chinese
         session.run("sphinx-intl", "update", "-p", "build/gettext", "-l", "zh_CN")
 
-        # Build documentation for each language
-        for lang in ["en_US", "zh_CN"]:
-            session.log(f"Building documentation for {lang}")
-            output_dir = f"build/html/{lang}"
-            session.run(
-                "sphinx-build",
-                "-b",
-                "html",
-                "-D",
-                f"language={lang}",
-                "source",
-                output_dir,
-                env={"SPHINX_LANGUAGE": lang},
-            )
+        # Build every language
+        build_languages(session, languages)
 
     # Create a simple language selection page
     index_html = """
@@ -413,6 +726,9 @@ def docs_build(session: Session) -> None:
 
     # Write the language selection page
     index_path = Path(get_docs_dir()) / "build" / "html" / "index.html"
-    index_path.write_text(index_html, encoding="utf-8")
+    _write_if_changed(index_path, index_html)
 
+    # Record the hash only after a successful build, and after sphinx-intl has
+    # refreshed the catalogs under source/locale, which are inputs as well
+    hash_path.write_text(_compute_docs_hash(), encoding="utf-8")
     session.log("Documentation built successfully for all languages")
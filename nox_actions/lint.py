@@ -3,12 +3,14 @@ import nox
 from nox_actions.utils import PACKAGE_NAME
 
 
+@nox.session(name="lint")
 def lint(session: nox.Session) -> None:
     session.install("isort", "ruff")
     session.run("isort", "--check-only", PACKAGE_NAME)
     session.run("ruff", "check")
 
 
+@nox.session(name="lint-fix")
 def lint_fix(session: nox.Session) -> None:
     session.install("isort", "ruff", "pre-commit", "autoflake")
     session.run("ruff", "check", "--fix")
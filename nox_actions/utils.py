@@ -1,19 +1,55 @@
 # Import built-in modules
+import os
 from pathlib import Path
+import stat
 
 
 PACKAGE_NAME = "persistent_ssh_agent"
-THIS_ROOT = Path(__file__).parent.parent
+THIS_ROOT = Path(__file__).resolve().parent.parent
 PROJECT_ROOT = THIS_ROOT.parent
 
 
 def _assemble_env_paths(*paths):
-    """Assemble environment paths separated by a semicolon.
+    """Assemble environment paths separated by the platform path separator.
 
     Args:
         *paths: Paths to be assembled.
 
     Returns:
-        str: Assembled paths separated by a semicolon.
+        str: Assembled paths separated by ``os.pathsep``.
     """
-    return ";".join(paths)
+    return os.pathsep.join(paths)
+
+
+def _remove(remove, path):
+    """Remove a file or directory, clearing its read-only flag if needed.
+
+    Args:
+        remove: ``os.unlink`` or ``os.rmdir``.
+        path: Path to remove.
+    """
+    try:
+        remove(path)
+    except PermissionError:
+        os.chmod(path, stat.S_IRWXU)
+        remove(path)
+
+
+def _fast_rmtree(path):
+    """Delete a directory tree.
+
+    Unlike ``shutil.rmtree``, this walks with ``os.scandir`` and uses the
+    cached entry type to decide whether to recurse. That saves a ``stat``
+    call per entry, and read-only entries are retried inline instead of
+    through an ``onerror`` callback.
+
+    Args:
+        path: Directory to delete.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                _remove(os.unlink, entry.path)
+    _remove(os.rmdir, path)
@@ -1,15 +1,56 @@
 """Persistent SSH Agent for managing SSH keys and connections."""
 
-# Import version
+# Import built-in modules
+import importlib
+from typing import Any
+from typing import TYPE_CHECKING
+
 # Import third-party modules
+# Import version
 from persistent_ssh_agent.__version__ import __version__
-
-# Import core components
-from persistent_ssh_agent.config import SSHConfig
 from persistent_ssh_agent.constants import SSHAgentConstants
-from persistent_ssh_agent.core import PersistentSSHAgent
 
 
+if TYPE_CHECKING:
+    # Import third-party modules
+    from persistent_ssh_agent.config import SSHConfig
+    from persistent_ssh_agent.core import PersistentSSHAgent
+
+# Core components are imported on first access, so the CLI commands that do not
+# need them (config, list, export, ...) skip loading the agent and its helpers
+_LAZY_ATTRIBUTES = {
+    "PersistentSSHAgent": "persistent_ssh_agent.core",
+    "SSHConfig": "persistent_ssh_agent.config",
+}
+
 # Import CLI components
 # Avoid circular imports by importing ConfigManager only when needed
 __all__ = ["PersistentSSHAgent", "SSHAgentConstants", "SSHConfig", "__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import core components on first access.
+
+    Args:
+        name: Attribute name
+
+    Returns:
+        Any: The requested component
+
+    Raises:
+        AttributeError: If the package has no such attribute
+    """
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list:
+    """List the package attributes, including the lazily imported ones.
+
+    Returns:
+        list: Attribute names
+    """
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
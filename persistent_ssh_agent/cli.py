@@ -2,6 +2,9 @@
 
 # Import built-in modules
 import base64
+import contextlib
+import copy
+import functools
 import getpass
 import hashlib
 import json
@@ -11,28 +14,44 @@ import socket
 import sys
 from typing import Any
 from typing import Dict
+from typing import Iterator
 from typing import Optional
+from typing import Set
 from typing import Tuple
 from typing import Union
 
 # Import third-party modules
 import click
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.ciphers import Cipher
-from cryptography.hazmat.primitives.ciphers.algorithms import AES
-from cryptography.hazmat.primitives.ciphers.modes import CBC
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from loguru import logger
-from persistent_ssh_agent import PersistentSSHAgent
-from persistent_ssh_agent.config import SSHConfig
 from persistent_ssh_agent.constants import CLIConstants
 from persistent_ssh_agent.constants import LoggingConstants
 from persistent_ssh_agent.constants import SystemConstants
 from persistent_ssh_agent.utils import run_command
 
 
+class _LazyLogger:
+    """Proxy for loguru's logger that defers importing loguru until first use.
+
+    ``persistent_ssh_agent.core`` imports this module for ``ConfigManager``,
+    so library users should not pay for loguru unless something is logged.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        """Resolve attributes on loguru's logger.
+
+        Args:
+            name: Attribute name
+
+        Returns:
+            Any: The attribute of loguru's logger
+        """
+        # Import third-party modules
+        from loguru import logger as loguru_logger
+
+        return getattr(loguru_logger, name)
+
+
 # Logger will be configured dynamically in main() based on --debug flag
+logger = _LazyLogger()
 
 
 class Args:
@@ -48,60 +67,277 @@ class Args:
             setattr(self, key, value)
 
 
+@functools.lru_cache(maxsize=1)
+def _derive_key(password: str, salt: bytes) -> bytes:
+    """Derive an encryption key with PBKDF2, memoized for the process lifetime.
+
+    Every encryption uses a fresh random salt, but decrypting the same stored
+    passphrase again (for example once per connection test or git command in
+    a long-running process) reuses the key instead of re-running every
+    iteration. Nothing is persisted to disk.
+
+    Args:
+        password: Password material
+        salt: Key derivation salt
+
+    Returns:
+        bytes: Derived key
+    """
+    # Import third-party modules
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=CLIConstants.KEY_SIZE,
+        salt=salt,
+        iterations=CLIConstants.KEY_DERIVATION_ITERATIONS,
+        backend=default_backend()
+    )
+    return kdf.derive(password.encode())
+
+
+@functools.lru_cache(maxsize=2)
+def _aead_cipher(key: bytes) -> Any:
+    """Build the AES-256-GCM cipher for a key, memoized per key.
+
+    ``AESGCM`` instances hold no per-message state, so one can serve every
+    encryption and decryption made with the same key.
+
+    Args:
+        key: Encryption key
+
+    Returns:
+        AESGCM: Cipher bound to ``key``
+    """
+    # Import third-party modules
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+    return AESGCM(key)
+
+
+@functools.lru_cache(maxsize=1)
+def _read_machine_id() -> str:
+    """Read a unique machine identifier, memoized for the process lifetime.
+
+    Returns:
+        str: Machine ID
+    """
+    # Try to get machine ID from common locations
+    machine_id = ""
+
+    # Linux
+    if os.path.exists(SystemConstants.LINUX_MACHINE_ID_PATH):
+        try:
+            with open(SystemConstants.LINUX_MACHINE_ID_PATH, "r", encoding=SystemConstants.DEFAULT_ENCODING) as f:
+                machine_id = f.read().strip()
+        except (IOError, OSError):
+            pass
+
+    # Windows
+    elif os.name == SystemConstants.WINDOWS_PLATFORM:
+        try:
+            # Import built-in modules
+            import winreg
+
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, SystemConstants.WINDOWS_MACHINE_GUID_REGISTRY_PATH) as key:
+                machine_id = winreg.QueryValueEx(key, SystemConstants.WINDOWS_MACHINE_GUID_KEY)[0]
+        except (ImportError, OSError):
+            pass
+
+    # Fallback to a hash of the hostname if we couldn't get a machine ID
+    if not machine_id:
+        machine_id = hashlib.sha256(socket.gethostname().encode()).hexdigest()
+
+    return machine_id
+
+
+# Configuration directories already created and locked down by this process
+_initialized_config_dirs: Set[Path] = set()
+
+
+@functools.lru_cache(maxsize=1)
+def _home_dir() -> Path:
+    """Resolve the user's home directory, memoized for the process lifetime.
+
+    Returns:
+        Path: Home directory
+    """
+    return Path.home()
+
+
 class ConfigManager:
     """Manages persistent configuration for SSH agent."""
 
+    # Last parsed configuration and the (st_mtime_ns, st_size) of the file it came from
+    _cache: Optional[Dict] = None
+    _cache_stamp: Optional[Tuple[int, int]] = None
+    # Configuration being edited inside transaction(), or None outside of one
+    _pending: Optional[Dict] = None
+    # Configuration read once by snapshot(), or None outside of one
+    _snapshot: Optional[Dict] = None
+
     def __init__(self):
         """Initialize configuration manager."""
-        self.config_dir = Path.home() / CLIConstants.CONFIG_DIR_NAME
+        self.config_dir = _home_dir() / CLIConstants.CONFIG_DIR_NAME
         self.config_file = self.config_dir / CLIConstants.CONFIG_FILE_NAME
         self._ensure_config_dir()
 
     def _ensure_config_dir(self) -> None:
         """Ensure configuration directory exists."""
+        if self.config_dir in _initialized_config_dirs:
+            return
         self.config_dir.mkdir(parents=True, exist_ok=True)
         # Set proper permissions for config directory
         if os.name != SystemConstants.WINDOWS_PLATFORM:  # Skip on Windows
             os.chmod(self.config_dir, CLIConstants.CONFIG_DIR_PERMISSIONS)
+        _initialized_config_dirs.add(self.config_dir)
 
-    def load_config(self) -> Dict:
-        """Load configuration from file.
+    def _get_config_stamp(self) -> Optional[Tuple[int, int]]:
+        """Get the modification stamp of the configuration file.
+
+        Returns:
+            Optional[Tuple[int, int]]: (st_mtime_ns, st_size), or None if the file does not exist
+        """
+        try:
+            stat_result = self.config_file.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        return stat_result.st_mtime_ns, stat_result.st_size
+
+    def _read_config(self) -> Dict:
+        """Get the parsed configuration without copying it.
+
+        The parsed configuration is cached and only re-read when the file's
+        modification time or size changes. The result is shared with the
+        cache, so callers must not modify it.
 
         Returns:
             Dict: Configuration dictionary
         """
-        if not self.config_file.exists():
+        stamp = self._get_config_stamp()
+        if stamp is None:
             return {}
 
+        if self._cache is not None and stamp == self._cache_stamp:
+            return self._cache
+
         try:
             with open(self.config_file, "r", encoding=SystemConstants.DEFAULT_ENCODING) as f:
-                return json.load(f)
+                config = json.load(f)
         except (json.JSONDecodeError, IOError) as e:
             logger.error(f"Failed to load configuration: {e}")
             return {}
 
+        self._cache = config
+        self._cache_stamp = stamp
+        return config
+
+    def load_config(self) -> Dict:
+        """Load configuration from file.
+
+        The parsed configuration is cached and only re-read when the file's
+        modification time or size changes.
+
+        Returns:
+            Dict: Configuration dictionary
+        """
+        # Callers mutate the result before saving, so never hand out the cached dict
+        return copy.deepcopy(self._read_config())
+
     def save_config(self, config: Dict) -> bool:
         """Save configuration to file.
 
+        The configuration is written to a temporary file created with the
+        final permissions and then renamed over the old file, so readers
+        never see a partially written configuration.
+
         Args:
             config: Configuration dictionary
 
         Returns:
             bool: True if successful
         """
+        data = json.dumps(config, indent=2).encode(SystemConstants.DEFAULT_ENCODING)
+        temp_file = self.config_file.with_name(f"{self.config_file.name}.{os.getpid()}.tmp")
+        # Creating the file with its final mode saves a separate chmod call
+        open_temp_file = functools.partial(
+            os.open,
+            temp_file,
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+            CLIConstants.CONFIG_FILE_PERMISSIONS,
+        )
         try:
-            with open(self.config_file, "w", encoding=SystemConstants.DEFAULT_ENCODING) as f:
-                json.dump(config, f, indent=2)
-
-            # Set proper permissions for config file
-            if os.name != SystemConstants.WINDOWS_PLATFORM:  # Skip on Windows
-                os.chmod(self.config_file, CLIConstants.CONFIG_FILE_PERMISSIONS)
-
+            try:
+                fd = open_temp_file()
+            except FileNotFoundError:
+                # The directory was removed after this process created it; recreate it once
+                _initialized_config_dirs.discard(self.config_dir)
+                self._ensure_config_dir()
+                fd = open_temp_file()
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_file, self.config_file)
+
+            # Write through to the cache so the next load does not re-parse the file
+            self._cache = copy.deepcopy(config)
+            self._cache_stamp = self._get_config_stamp()
             return True
         except IOError as e:
             logger.error(f"Failed to save configuration: {e}")
+            with contextlib.suppress(OSError):
+                temp_file.unlink()
             return False
 
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[Dict]:
+        """Group several configuration changes into a single load and save.
+
+        Setters called inside the block modify the configuration in memory;
+        it is written once when the block completes, and not at all if
+        nothing changed. If the block raises, none of its changes are saved.
+        A nested ``transaction()`` joins the outermost one, so helpers can
+        batch their own changes without forcing an intermediate write.
+
+        Yields:
+            Dict: The configuration being edited
+
+        Raises:
+            IOError: If the configuration could not be saved
+        """
+        if self._pending is not None:
+            # The outermost transaction saves (or discards) the changes
+            yield self._pending
+            return
+
+        self._pending = self.load_config()
+        original = copy.deepcopy(self._pending)
+        try:
+            yield self._pending
+            pending = self._pending
+        finally:
+            self._pending = None
+        # Nothing to write if the block left the configuration as it was
+        if pending != original and not self.save_config(pending):
+            raise IOError("Failed to save configuration")
+
+    @contextlib.contextmanager
+    def snapshot(self) -> Iterator[Dict]:
+        """Serve the getters from a single read of the configuration.
+
+        The block is meant for reading; values set inside it are saved but
+        are not visible to the getters until the block ends.
+
+        Yields:
+            Dict: The configuration as read on entry
+        """
+        self._snapshot = self.load_config()
+        try:
+            yield self._snapshot
+        finally:
+            self._snapshot = None
+
     def _get_config_value(self, key: str) -> Optional[Any]:
         """Get a value from the configuration.
 
@@ -111,12 +347,43 @@ class ConfigManager:
         Returns:
             Optional[Any]: Configuration value or None
         """
-        config = self.load_config()
+        if self._pending is not None:
+            config = self._pending
+        elif self._snapshot is not None:
+            config = self._snapshot
+        else:
+            # Values are only read here, so the cached configuration needs no copy
+            config = self._read_config()
         return config.get(key)
 
+    def _config_for_update(self) -> Dict:
+        """Get the configuration a setter should modify.
+
+        Returns:
+            Dict: The configuration being edited inside ``transaction()``, otherwise a fresh load
+        """
+        return self.load_config() if self._pending is None else self._pending
+
+    def _commit_config(self, config: Dict) -> bool:
+        """Store a configuration modified by a setter.
+
+        Inside ``transaction()`` the change stays in memory until the block ends.
+
+        Args:
+            config: Configuration returned by ``_config_for_update()``
+
+        Returns:
+            bool: True if successful
+        """
+        if config is self._pending:
+            return True
+        return self.save_config(config)
+
     def _set_config_value(self, key: str, value: Any) -> bool:
         """Set a value in the configuration.
 
+        Inside ``transaction()`` the value is only recorded in memory.
+
         Args:
             key: Configuration key
             value: Configuration value
@@ -124,9 +391,9 @@ class ConfigManager:
         Returns:
             bool: True if successful
         """
-        config = self.load_config()
+        config = self._config_for_update()
         config[key] = value
-        return self.save_config(config)
+        return self._commit_config(config)
 
     def get_passphrase(self) -> Optional[str]:
         """Get stored passphrase.
@@ -214,7 +481,7 @@ class ConfigManager:
         Returns:
             Dict: Dictionary of configured keys
         """
-        config = self.load_config()
+        config = self._read_config()
         result = {}
 
         # Add default key if exists
@@ -239,18 +506,18 @@ class ConfigManager:
         Returns:
             bool: True if successful
         """
-        config = self.load_config()
-
         # Handle default key
         if name == "default":
             return self.set_identity_file(identity_file)
 
+        config = self._config_for_update()
+
         # Handle named keys
         if "keys" not in config:
             config["keys"] = {}
 
         config["keys"][name] = os.path.expanduser(identity_file)
-        return self.save_config(config)
+        return self._commit_config(config)
 
     def remove_key(self, name: str) -> bool:
         """Remove a named SSH key.
@@ -261,7 +528,7 @@ class ConfigManager:
         Returns:
             bool: True if successful
         """
-        config = self.load_config()
+        config = self._config_for_update()
         updated = False
 
         # Handle default key
@@ -278,7 +545,7 @@ class ConfigManager:
             if not config["keys"]:
                 config.pop("keys")
 
-        return self.save_config(config) if updated else False
+        return self._commit_config(config) if updated else False
 
     def clear_config(self) -> bool:
         """Clear all configuration.
@@ -286,7 +553,9 @@ class ConfigManager:
         Returns:
             bool: True if successful
         """
-        return self.save_config({})
+        config = self._config_for_update()
+        config.clear()
+        return self._commit_config(config)
 
     def export_config(self, include_sensitive: bool = False) -> Dict:
         """Export configuration.
@@ -329,30 +598,29 @@ class ConfigManager:
             return False
 
         # Get current configuration
-        current_config = self.load_config()
+        current_config = self._config_for_update()
 
         # Update current configuration with imported data
         current_config.update(config_data)
 
-        return self.save_config(current_config)
+        return self._commit_config(current_config)
 
-    def _derive_key_from_system(self) -> Tuple[bytes, bytes]:
+    def _derive_key_from_system(self, salt: bytes) -> bytes:
         """Derive encryption key from system-specific information.
 
+        Args:
+            salt: Random salt stored with the encrypted passphrase
+
         Returns:
-            Tuple[bytes, bytes]: (key, salt)
+            bytes: Derived key
         """
         # Get system-specific information
         try:
-            # Get username with fallbacks for CI environments
-            username = self._get_username()
-
             # Get system information
             system_info = {
                 "hostname": socket.gethostname(),
                 "machine_id": self._get_machine_id(),
-                "username": username,
-                "home": str(Path.home()),
+                "home": str(_home_dir()),
             }
         except Exception as e:
             # If all else fails, use a default set of values
@@ -360,44 +628,14 @@ class ConfigManager:
             system_info = {
                 "hostname": SystemConstants.UNKNOWN_HOST,
                 "machine_id": SystemConstants.UNKNOWN_MACHINE,
-                "username": SystemConstants.UNKNOWN_USER,
                 "home": SystemConstants.UNKNOWN_HOME,
             }
 
-        # Create a deterministic salt from system info
-        salt_base = f"{system_info['hostname']}:{system_info['machine_id']}:{system_info['username']}"
-        salt = hashlib.sha256(salt_base.encode()).digest()[:CLIConstants.SALT_SIZE]
-
-        # Derive key using PBKDF2
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=CLIConstants.KEY_SIZE,
-            salt=salt,
-            iterations=CLIConstants.KEY_DERIVATION_ITERATIONS,
-            backend=default_backend()
-        )
-
         # Use a combination of system info as the password
         password = f"{system_info['hostname']}:{system_info['machine_id']}:{system_info['home']}"
-        key = kdf.derive(password.encode())
-
-        return key, salt
 
-    def _get_username(self) -> str:
-        """Get current username with fallbacks for CI environments.
-
-        Returns:
-            str: Username
-        """
-        try:
-            return os.getlogin()
-        except (AttributeError, OSError):
-            try:
-                return getpass.getuser()
-            except Exception:
-                # Last resort fallback for CI environments
-                user = os.environ.get(SystemConstants.ENV_USER, "")
-                return user or os.environ.get(SystemConstants.ENV_USERNAME, SystemConstants.UNKNOWN_USER)
+        # Derive key using PBKDF2; decrypting the same stored passphrase again hits the cache
+        return _derive_key(password, salt)
 
     def _get_machine_id(self) -> str:
         """Get a unique machine identifier.
@@ -405,36 +643,10 @@ class ConfigManager:
         Returns:
             str: Machine ID
         """
-        # Try to get machine ID from common locations
-        machine_id = ""
-
-        # Linux
-        if os.path.exists(SystemConstants.LINUX_MACHINE_ID_PATH):
-            try:
-                with open(SystemConstants.LINUX_MACHINE_ID_PATH, "r", encoding=SystemConstants.DEFAULT_ENCODING) as f:
-                    machine_id = f.read().strip()
-            except (IOError, OSError):
-                pass
-
-        # Windows
-        elif os.name == SystemConstants.WINDOWS_PLATFORM:
-            try:
-                # Import built-in modules
-                import winreg
-
-                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, SystemConstants.WINDOWS_MACHINE_GUID_REGISTRY_PATH) as key:
-                    machine_id = winreg.QueryValueEx(key, SystemConstants.WINDOWS_MACHINE_GUID_KEY)[0]
-            except (ImportError, OSError):
-                pass
-
-        # Fallback to a hash of the hostname if we couldn't get a machine ID
-        if not machine_id:
-            machine_id = hashlib.sha256(socket.gethostname().encode()).hexdigest()
-
-        return machine_id
+        return _read_machine_id()
 
     def _encrypt_passphrase(self, passphrase: str) -> str:
-        """Encrypt passphrase using AES-256.
+        """Encrypt passphrase using AES-256-GCM.
 
         Args:
             passphrase: Plain text passphrase
@@ -443,59 +655,76 @@ class ConfigManager:
             str: Encrypted passphrase
         """
         try:
-            # Get key and salt
-            key, salt = self._derive_key_from_system()
-
-            # Generate a random IV
-            iv = os.urandom(CLIConstants.IV_SIZE)
+            # Draw a fresh salt and nonce with a single call to the OS random source
+            random_bytes = os.urandom(CLIConstants.SALT_SIZE + CLIConstants.GCM_NONCE_SIZE)
+            salt = random_bytes[: CLIConstants.SALT_SIZE]
+            nonce = random_bytes[CLIConstants.SALT_SIZE :]
 
-            # Create an encryptor
-            cipher = Cipher(AES(key), CBC(iv), backend=default_backend())
-            encryptor = cipher.encryptor()
+            # Get key for this salt
+            key = self._derive_key_from_system(salt)
 
-            # Pad the plaintext to a multiple of 16 bytes (AES block size)
-            plaintext = self._pad_data(passphrase.encode())
+            # Encrypt and authenticate in one call; the tag is appended to the ciphertext
+            ciphertext = _aead_cipher(key).encrypt(nonce, passphrase.encode(), None)
 
-            # Encrypt the padded plaintext
-            ciphertext = encryptor.update(plaintext) + encryptor.finalize()
+            # Combine salt, nonce, and ciphertext
+            encrypted_data = salt + nonce + ciphertext
 
-            # Combine salt, IV, and ciphertext
-            encrypted_data = salt + iv + ciphertext
-
-            # Encode as base64 for storage
-            return base64.b64encode(encrypted_data).decode()
+            # Encode as base64 for storage, tagged with the format it was written in
+            return CLIConstants.ENCRYPTION_FORMAT_PREFIX + base64.b64encode(encrypted_data).decode()
 
         except Exception as e:
             logger.error(f"Failed to encrypt passphrase: {e}")
             raise
 
-    def _pad_data(self, data: bytes) -> bytes:
-        """Pad data to a multiple of 16 bytes (AES block size) using PKCS7 padding.
+    def _unpad_data(self, padded_data: bytes) -> bytes:
+        """Remove PKCS7 padding from data.
 
         Args:
-            data: Data to pad
+            padded_data: Padded data
 
         Returns:
-            bytes: Padded data
+            bytes: Unpadded data
+
+        Raises:
+            ValueError: If the padding is invalid, e.g. because the wrong key was used
         """
-        padding_length = CLIConstants.AES_BLOCK_SIZE - (len(data) % CLIConstants.AES_BLOCK_SIZE)
-        return data + bytes([padding_length]) * padding_length
+        # Import third-party modules
+        from cryptography.hazmat.primitives.padding import PKCS7
 
-    def _unpad_data(self, padded_data: bytes) -> bytes:
-        """Remove PKCS7 padding from data.
+        unpadder = PKCS7(CLIConstants.AES_BLOCK_SIZE * 8).unpadder()
+        return unpadder.update(padded_data) + unpadder.finalize()
+
+    def _decrypt_legacy_cbc(self, key: bytes, payload: Union[bytes, memoryview]) -> bytes:
+        """Decrypt a passphrase stored in the AES-256-CBC format used before AES-GCM.
 
         Args:
-            padded_data: Padded data
+            key: Encryption key
+            payload: IV followed by the PKCS7-padded ciphertext
 
         Returns:
-            bytes: Unpadded data
+            bytes: Plain text passphrase
         """
-        padding_length = padded_data[-1]
-        return padded_data[:-padding_length]
+        # Import third-party modules
+        from cryptography.hazmat.backends import default_backend
+        from cryptography.hazmat.primitives.ciphers import Cipher
+        from cryptography.hazmat.primitives.ciphers.algorithms import AES
+        from cryptography.hazmat.primitives.ciphers.modes import CBC
+
+        iv = bytes(payload[: CLIConstants.IV_SIZE])
+        ciphertext = payload[CLIConstants.IV_SIZE :]
+
+        decryptor = Cipher(AES(key), CBC(iv), backend=default_backend()).decryptor()
+        padded_plaintext = decryptor.update(ciphertext) + decryptor.finalize()
+        return self._unpad_data(padded_plaintext)
 
     def deobfuscate_passphrase(self, encrypted_data: str) -> str:
         """Decrypt passphrase.
 
+        Passphrases stored in the older AES-CBC format are still accepted.
+        Values carrying the AES-GCM format prefix are never decrypted as
+        CBC, so a wrong key or tampered data raises instead of returning
+        garbage.
+
         Args:
             encrypted_data: Encrypted passphrase
 
@@ -503,25 +732,25 @@ class ConfigManager:
             str: Plain text passphrase
         """
         try:
-            # Decode base64 data
-            data = base64.b64decode(encrypted_data)
+            authenticated = encrypted_data.startswith(CLIConstants.ENCRYPTION_FORMAT_PREFIX)
+            if authenticated:
+                encrypted_data = encrypted_data[len(CLIConstants.ENCRYPTION_FORMAT_PREFIX) :]
 
-            # Extract IV and ciphertext (salt is not used as we get it from _derive_key_from_system)
-            iv = data[CLIConstants.SALT_SIZE : CLIConstants.SALT_SIZE + CLIConstants.IV_SIZE]
-            ciphertext = data[CLIConstants.SALT_SIZE + CLIConstants.IV_SIZE :]
+            # Decode base64 data; slice through a view so the payload is not copied
+            data = memoryview(base64.b64decode(encrypted_data))
 
-            # Get key using the same method as encryption
-            key, _ = self._derive_key_from_system()
+            salt = bytes(data[: CLIConstants.SALT_SIZE])
+            payload = data[CLIConstants.SALT_SIZE :]
 
-            # Create a decryptor
-            cipher = Cipher(AES(key), CBC(iv), backend=default_backend())
-            decryptor = cipher.decryptor()
+            # Get key using the same method as encryption, with the stored salt
+            key = self._derive_key_from_system(salt)
 
-            # Decrypt the ciphertext
-            padded_plaintext = decryptor.update(ciphertext) + decryptor.finalize()
-
-            # Remove padding
-            plaintext = self._unpad_data(padded_plaintext)
+            if authenticated:
+                # Raises InvalidTag for a wrong key or tampered data
+                nonce = payload[: CLIConstants.GCM_NONCE_SIZE]
+                plaintext = _aead_cipher(key).decrypt(nonce, payload[CLIConstants.GCM_NONCE_SIZE :], None)
+            else:
+                plaintext = self._decrypt_legacy_cbc(key, payload)
 
             return plaintext.decode()
 
@@ -533,25 +762,25 @@ class ConfigManager:
     def secure_delete_from_memory(data: Union[str, bytes, bytearray]) -> None:
         """Securely delete sensitive data from memory.
 
+        Only a ``bytearray`` can be overwritten in place. ``str`` and
+        ``bytes`` objects are immutable, so they are left untouched.
+
         Args:
             data: Data to delete
         """
-        if isinstance(data, str):
-            # For strings, we can't modify the bytes directly
-            # This is a best-effort approach
-            data = "0" * len(data)
-            return
-
         if isinstance(data, bytearray):
-            # For bytearrays, we can modify in place
-            for i, _ in enumerate(data):
-                data[i] = 0
-            return
+            # Same-length slice assignment overwrites the existing buffer
+            data[:] = bytes(len(data))
+
+
+@functools.lru_cache(maxsize=1)
+def get_config_manager() -> ConfigManager:
+    """Get the configuration manager shared by the CLI commands.
 
-        # For bytes, we can't modify (immutable), but we can try to
-        # encourage garbage collection by removing references
-        if isinstance(data, bytes):
-            del data
+    Returns:
+        ConfigManager: Process-wide configuration manager
+    """
+    return ConfigManager()
 
 
 def setup_config(args):
@@ -560,24 +789,25 @@ def setup_config(args):
     Args:
         args: Command line arguments
     """
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
 
-    # Process configuration options
+    # Process configuration options, writing the configuration file once
     try:
-        # Handle identity file
-        if args.identity_file:
-            _set_identity_file(config_manager, args.identity_file)
+        with config_manager.transaction():
+            # Handle identity file
+            if args.identity_file:
+                _set_identity_file(config_manager, args.identity_file)
 
-        # Handle passphrase
-        _set_passphrase(config_manager, args)
+            # Handle passphrase
+            _set_passphrase(config_manager, args)
 
-        # Handle expiration time
-        if hasattr(args, "expiration") and args.expiration is not None:
-            _set_expiration_time(config_manager, args.expiration)
+            # Handle expiration time
+            if hasattr(args, "expiration") and args.expiration is not None:
+                _set_expiration_time(config_manager, args.expiration)
 
-        # Handle reuse agent
-        if hasattr(args, "reuse_agent") and args.reuse_agent is not None:
-            _set_reuse_agent(config_manager, args.reuse_agent)
+            # Handle reuse agent
+            if hasattr(args, "reuse_agent") and args.reuse_agent is not None:
+                _set_reuse_agent(config_manager, args.reuse_agent)
 
     except SystemExit:
         # Re-raise any SystemExit exceptions
@@ -621,17 +851,12 @@ def _set_passphrase(config_manager, args):
     else:
         return  # No passphrase to set
 
-    try:
-        # Set passphrase
-        if config_manager.set_passphrase(passphrase):
-            logger.info("Passphrase set successfully")
-        else:
-            logger.error("Failed to set passphrase")
-            sys.exit(1)
-    finally:
-        # Always securely delete passphrase from memory
-        if passphrase:
-            config_manager.secure_delete_from_memory(passphrase)
+    # Set passphrase
+    if config_manager.set_passphrase(passphrase):
+        logger.info("Passphrase set successfully")
+    else:
+        logger.error("Failed to set passphrase")
+        sys.exit(1)
 
 
 def _set_expiration_time(config_manager, expiration_hours):
@@ -672,25 +897,28 @@ def run_ssh_connection_test(args):
     Args:
         args: Command line arguments
     """
-    config_manager = ConfigManager()
-    passphrase = None
+    config_manager = get_config_manager()
 
     try:
-        # Get and validate identity file
-        identity_file = _get_and_validate_identity_file(args, config_manager)
-
-        # Get passphrase if available
-        passphrase = _get_passphrase_for_test(config_manager)
+        # Read the configuration once for all of the lookups below
+        with config_manager.snapshot():
+            # Get and validate identity file
+            identity_file = _get_and_validate_identity_file(args, config_manager)
 
-        # Log configuration settings
-        _log_test_configuration(args, config_manager)
+            # Log configuration settings
+            _log_test_configuration(args, config_manager)
 
         # Set up verbosity level if requested
         if hasattr(args, "verbose") and args.verbose:
             _configure_verbose_logging()
 
-        # Create SSH configuration and agent
-        ssh_config = SSHConfig(identity_file=identity_file, identity_passphrase=passphrase)
+        # Import third-party modules
+        from persistent_ssh_agent.config import SSHConfig
+        from persistent_ssh_agent.core import PersistentSSHAgent
+
+        # Create SSH configuration and agent. The stored passphrase is left out on purpose:
+        # the key manager only decrypts it when the key actually asks for one
+        ssh_config = SSHConfig(identity_file=identity_file)
         ssh_agent = PersistentSSHAgent(config=ssh_config)
 
         # Test connection
@@ -704,10 +932,6 @@ def run_ssh_connection_test(args):
     except Exception as e:
         logger.error(f"SSH connection test failed: {e}")
         sys.exit(1)
-    finally:
-        # Always clean up sensitive data
-        if passphrase:
-            config_manager.secure_delete_from_memory(passphrase)
 
 
 def _get_and_validate_identity_file(args, config_manager):
@@ -737,22 +961,6 @@ def _get_and_validate_identity_file(args, config_manager):
     return identity_file
 
 
-def _get_passphrase_for_test(config_manager):
-    """Get passphrase from config if available.
-
-    Args:
-        config_manager: ConfigManager instance
-
-    Returns:
-        Optional[str]: Passphrase or None
-    """
-    stored_passphrase = config_manager.get_passphrase()
-    if stored_passphrase:
-        # Use deobfuscate_passphrase method to get plain text passphrase
-        return config_manager.deobfuscate_passphrase(stored_passphrase)
-    return None
-
-
 def _log_test_configuration(args, config_manager):
     """Log test configuration settings.
 
@@ -798,7 +1006,7 @@ def list_keys(_):
     Args:
         _: Command line arguments (unused)
     """
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
 
     try:
         keys = config_manager.list_keys()
@@ -821,7 +1029,7 @@ def add_key(args):
     Args:
         args: Command line arguments
     """
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
 
     # Check required arguments
     if not hasattr(args, "name") or not args.name:
@@ -853,7 +1061,7 @@ def remove_key(args):
     Args:
         args: Command line arguments
     """
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
 
     if args.all:
         # Remove all keys
@@ -880,24 +1088,26 @@ def export_config(args):
     Args:
         args: Command line arguments
     """
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
 
     # Export configuration
     config = config_manager.export_config(include_sensitive=args.include_sensitive)
+    # Serialize once and hand the whole document to a single write
+    config_json = json.dumps(config, indent=2)
 
     # Print configuration
     if args.output:
         # Write to file
         try:
             with open(args.output, "w", encoding="utf-8") as f:
-                json.dump(config, f, indent=2)
+                f.write(config_json)
             logger.info(f"Configuration exported to {args.output}")
         except IOError as e:
             logger.error(f"Failed to export configuration: {e}")
             sys.exit(1)
     else:
         # Print to console
-        print(json.dumps(config, indent=2))
+        print(config_json)
 
 
 def import_config(args):
@@ -906,7 +1116,7 @@ def import_config(args):
     Args:
         args: Command line arguments
     """
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     config = {}  # Initialize config to avoid UnboundLocalError
 
     # Read configuration
@@ -1065,6 +1275,9 @@ def git_setup_cmd(ctx, username, password, prompt):
             logger.debug("Password provided: %s", bool(password))
             logger.debug("Prompt mode: %s", prompt)
 
+        # Import third-party modules
+        from persistent_ssh_agent.core import PersistentSSHAgent
+
         ssh_agent = PersistentSSHAgent()
         if ssh_agent.git.setup_git_credentials(username, password):
             logger.info("✅ Git credentials configured successfully")
@@ -1084,6 +1297,9 @@ def git_setup_cmd(ctx, username, password, prompt):
 def git_debug_cmd(ctx):
     """Debug Git credential helper configuration."""
     try:
+        # Import third-party modules
+        from persistent_ssh_agent.core import PersistentSSHAgent
+
         ssh_agent = PersistentSSHAgent()
 
         # Get current credential helpers
@@ -1172,6 +1388,9 @@ def git_clear_cmd(ctx, confirm):
     and is completely independent of SSH keys or SSH agent configuration.
     """
     try:
+        # Import third-party modules
+        from persistent_ssh_agent.core import PersistentSSHAgent
+
         ssh_agent = PersistentSSHAgent()
 
         # Get current credential helpers
@@ -1247,6 +1466,9 @@ def git_run_cmd(ctx, git_args, username, password, prefer_credentials, prompt):
 
         logger.info("🚀 Running Git command: %s", " ".join(git_command))
 
+        # Import third-party modules
+        from persistent_ssh_agent.core import PersistentSSHAgent
+
         # Create SSH agent instance
         ssh_agent = PersistentSSHAgent()
 
@@ -93,8 +93,12 @@ class CLIConstants:
     KEY_DERIVATION_ITERATIONS: ClassVar[int] = 100000
     SALT_SIZE: ClassVar[int] = 16
     IV_SIZE: ClassVar[int] = 16
+    GCM_NONCE_SIZE: ClassVar[int] = 12
     KEY_SIZE: ClassVar[int] = 32  # 256 bits
     AES_BLOCK_SIZE: ClassVar[int] = 16
+    # Marks passphrases sealed with AES-GCM; values without it use the legacy AES-CBC format.
+    # ":" is not part of the base64 alphabet, so a legacy value can never start with it
+    ENCRYPTION_FORMAT_PREFIX: ClassVar[str] = "v2:"
 
     # Time conversion constants
     SECONDS_PER_HOUR: ClassVar[int] = 3600
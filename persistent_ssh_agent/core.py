@@ -29,16 +29,6 @@ from persistent_ssh_agent.utils import extract_hostname
 from persistent_ssh_agent.utils import run_command
 
 
-# Import local modules (conditional to avoid circular imports)
-try:
-    # Import third-party modules
-    from persistent_ssh_agent.cli import ConfigManager
-
-    _has_cli = True
-except ImportError:
-    _has_cli = False
-
-
 logger = logging.getLogger(__name__)
 
 # Type definitions
@@ -591,8 +581,9 @@ class PersistentSSHAgent:
         """Get identity file from CLI configuration.
 
         This method attempts to retrieve the identity file path from the CLI configuration
-        manager if available. It checks if the CLI module is loaded, creates a ConfigManager
-        instance, and retrieves the identity file path. It also verifies that the file exists.
+        manager if available. It imports the CLI module on first use, reuses the shared
+        ConfigManager from ``get_config_manager()``, and retrieves the identity file path.
+        It also verifies that the file exists.
 
         Returns:
             Optional[str]: Path to identity file or None if not found, CLI module is not
@@ -604,15 +595,18 @@ class PersistentSSHAgent:
             >>> if identity_file:
             ...     print(f"Using identity file: {identity_file}")
         """
-        if not _has_cli:
-            return None
-
         try:
-            config_manager = ConfigManager()
+            # Imported here so that importing the library does not load click and the CLI
+            # Import third-party modules
+            from persistent_ssh_agent.cli import get_config_manager
+
+            config_manager = get_config_manager()
             cli_identity_file = config_manager.get_identity_file()
             if cli_identity_file and os.path.exists(os.path.expanduser(cli_identity_file)):
                 logger.debug("Using identity file from CLI config: %s", cli_identity_file)
                 return os.path.expanduser(cli_identity_file)
+        except ImportError:
+            logger.debug("CLI module not available")
         except Exception as e:
             logger.debug("Failed to get identity file from CLI config: %s", e)
 
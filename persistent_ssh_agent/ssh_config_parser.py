@@ -9,15 +9,55 @@ from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 
 # Type definitions
 SSHOptionValue = Union[str, List[str]]
+FileStamp = Optional[Tuple[int, int]]
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# Parsed SSH configs shared by every parser in the process, keyed by config path.
+# Each entry holds the stamps of the files and include directories it was built from.
+_parsed_configs: Dict[str, Tuple[Dict[str, FileStamp], Dict[str, Dict[str, SSHOptionValue]]]] = {}
+
+
+def _get_file_stamp(path: Union[str, Path]) -> FileStamp:
+    """Get the stamp used to detect changes to a file or directory.
+
+    Args:
+        path: Path to stat
+
+    Returns:
+        FileStamp: (st_mtime_ns, st_size), or None if the path cannot be stat'ed
+    """
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
+def _copy_config(config: Dict[str, Dict[str, SSHOptionValue]]) -> Dict[str, Dict[str, SSHOptionValue]]:
+    """Copy a parsed SSH config.
+
+    Values are strings or lists of strings, so copying the host dictionaries and
+    the lists is enough and much cheaper than ``copy.deepcopy``.
+
+    Args:
+        config: Parsed SSH config
+
+    Returns:
+        Dict[str, Dict[str, SSHOptionValue]]: Independent copy of the config
+    """
+    return {
+        host: {key: value[:] if isinstance(value, list) else value for key, value in options.items()}
+        for host, options in config.items()
+    }
+
 
 class SSHConfigParser:
     """Parser for SSH configuration files."""
@@ -30,6 +70,8 @@ class SSHConfigParser:
         """
         self.ssh_dir = ssh_dir
         self._config_cache: Dict[str, Dict[str, SSHOptionValue]] = {}
+        # Stamps of every file and include directory read by the current parse
+        self._file_stamps: Dict[str, FileStamp] = {}
 
     def parse_ssh_config(self) -> Dict[str, Dict[str, SSHOptionValue]]:
         """Parse SSH config file to get host-specific configurations.
@@ -39,6 +81,9 @@ class SSHConfigParser:
             The outer dictionary maps host patterns to their configurations,
             while the inner dictionary maps configuration keys to their values.
             Values can be either strings or lists of strings for multi-value options.
+
+        The result is cached for the whole process and only re-parsed when the
+        config file, an included file or an include directory changes.
         """
         config: Dict[str, Dict[str, SSHOptionValue]] = {}
         current_host: Optional[str] = None
@@ -49,6 +94,12 @@ class SSHConfigParser:
             logger.debug("SSH config file does not exist: %s", ssh_config_path)
             return config
 
+        cache_key = str(ssh_config_path)
+        cached = _parsed_configs.get(cache_key)
+        if cached is not None and all(_get_file_stamp(path) == stamp for path, stamp in cached[0].items()):
+            return _copy_config(cached[1])
+        self._file_stamps = {cache_key: _get_file_stamp(ssh_config_path)}
+
         # Define valid keys and their validation functions
         valid_keys = self._get_valid_keys()
 
@@ -163,10 +214,14 @@ class SSHConfigParser:
         except Exception as e:
             logger.error(f"Failed to parse SSH config: {e}")
             config.clear()
+            return config
 
         if not config:
             logger.debug("No valid configuration found in SSH config file")
 
+        # A config that cannot be stat'ed cannot be checked for changes later
+        if self._file_stamps[cache_key] is not None:
+            _parsed_configs[cache_key] = (self._file_stamps, _copy_config(config))
         return config
 
     def _get_valid_keys(self) -> Dict[str, Callable[[str], bool]]:
@@ -239,10 +294,21 @@ class SSHConfigParser:
         if not os.path.isabs(include_path):
             include_path = os.path.join(os.path.dirname(str(ssh_config_path)), include_path)
 
+        # Adding or removing a matching file changes the stamp of its directory. A
+        # wildcard directory pattern cannot be stat'ed, so stamp every directory it
+        # matches and, level by level, the directories those matches live in.
+        include_dir = os.path.dirname(include_path)
+        while glob.has_magic(include_dir):
+            for matched_dir in glob.glob(include_dir):
+                self._file_stamps[matched_dir] = _get_file_stamp(matched_dir)
+            include_dir = os.path.dirname(include_dir)
+        self._file_stamps[include_dir] = _get_file_stamp(include_dir)
+
         # Expand glob patterns
         include_files = glob.glob(include_path)
         for include_file in include_files:
             if os.path.isfile(include_file):
+                self._file_stamps[include_file] = _get_file_stamp(include_file)
                 try:
                     with open(include_file) as inc_f:
                         for inc_line in inc_f:
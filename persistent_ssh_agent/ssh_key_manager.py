@@ -250,9 +250,9 @@ class SSHKeyManager:
         """
         try:
             # Import third-party modules
-            from persistent_ssh_agent.cli import ConfigManager
+            from persistent_ssh_agent.cli import get_config_manager
 
-            config_manager = ConfigManager()
+            config_manager = get_config_manager()
             cli_passphrase = config_manager.get_passphrase()
             if cli_passphrase:
                 return config_manager.deobfuscate_passphrase(cli_passphrase)
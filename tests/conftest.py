@@ -8,10 +8,34 @@ import subprocess
 import tempfile
 
 # Import third-party modules
+from persistent_ssh_agent.cli import _aead_cipher
+from persistent_ssh_agent.cli import _derive_key
+from persistent_ssh_agent.cli import _home_dir
+from persistent_ssh_agent.cli import _initialized_config_dirs
+from persistent_ssh_agent.cli import _read_machine_id
+from persistent_ssh_agent.cli import get_config_manager
 from persistent_ssh_agent.core import PersistentSSHAgent
+from persistent_ssh_agent.ssh_config_parser import _parsed_configs
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def clear_cli_caches():
+    """Reset the process-wide CLI caches so mocked system info cannot leak between tests."""
+    _aead_cipher.cache_clear()
+    _derive_key.cache_clear()
+    _read_machine_id.cache_clear()
+    _home_dir.cache_clear()
+    _initialized_config_dirs.clear()
+    get_config_manager.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_ssh_config_cache():
+    """Reset the process-wide parsed SSH config cache so mocked files cannot leak between tests."""
+    _parsed_configs.clear()
+
+
 @pytest.fixture
 def ssh_manager():
     """Create a PersistentSSHAgent instance."""
@@ -147,7 +147,7 @@ def test_setup_config_reuse_agent(mock_exists, mock_config_manager):
 
 
 @patch("persistent_ssh_agent.cli.ConfigManager")
-@patch("persistent_ssh_agent.cli.PersistentSSHAgent")
+@patch("persistent_ssh_agent.core.PersistentSSHAgent")
 @patch("persistent_ssh_agent.cli.os.path.exists", return_value=True)
 def test_run_ssh_connection_test_with_expiration(mock_exists, mock_agent, mock_config_manager):
     """Test testing a connection with expiration time."""
@@ -178,7 +178,7 @@ def test_run_ssh_connection_test_with_expiration(mock_exists, mock_agent, mock_c
 
 
 @patch("persistent_ssh_agent.cli.ConfigManager")
-@patch("persistent_ssh_agent.cli.PersistentSSHAgent")
+@patch("persistent_ssh_agent.core.PersistentSSHAgent")
 @patch("persistent_ssh_agent.cli.os.path.exists", return_value=True)
 def test_run_ssh_connection_test_with_reuse_agent(mock_exists, mock_agent, mock_config_manager):
     """Test testing a connection with reuse agent."""
@@ -209,7 +209,7 @@ def test_run_ssh_connection_test_with_reuse_agent(mock_exists, mock_agent, mock_
 
 
 @patch("persistent_ssh_agent.cli.ConfigManager")
-@patch("persistent_ssh_agent.cli.PersistentSSHAgent")
+@patch("persistent_ssh_agent.core.PersistentSSHAgent")
 @patch("persistent_ssh_agent.cli.os.path.exists", return_value=True)
 def test_run_ssh_connection_test_with_verbose(mock_exists, mock_agent, mock_config_manager):
     """Test testing a connection with verbose output."""
@@ -1,17 +1,28 @@
 """Comprehensive tests for CLI module to improve coverage."""
 
 # Import built-in modules
+import base64
 import hashlib
 import json
 import os
 from pathlib import Path
+import shutil
 import tempfile
 from unittest.mock import MagicMock
 from unittest.mock import mock_open
 from unittest.mock import patch
 
 # Import third-party modules
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers import Cipher
+from cryptography.hazmat.primitives.ciphers.algorithms import AES
+from cryptography.hazmat.primitives.ciphers.modes import CBC
 from persistent_ssh_agent.cli import ConfigManager
+from persistent_ssh_agent.cli import _aead_cipher
+from persistent_ssh_agent.cli import _derive_key
+from persistent_ssh_agent.cli import _home_dir
+from persistent_ssh_agent.cli import _read_machine_id
+from persistent_ssh_agent.cli import get_config_manager
 from persistent_ssh_agent.constants import CLIConstants
 from persistent_ssh_agent.constants import SystemConstants
 import pytest
@@ -43,6 +54,11 @@ class TestConfigManagerInitialization:
         assert manager.config_dir.name == CLIConstants.CONFIG_DIR_NAME
         assert manager.config_file.name == CLIConstants.CONFIG_FILE_NAME
 
+    def test_get_config_manager_is_shared(self):
+        """Test that the CLI commands share one ConfigManager per process."""
+        assert get_config_manager() is get_config_manager()
+        assert isinstance(get_config_manager(), ConfigManager)
+
     def test_ensure_config_dir_creation(self, temp_config_dir):
         """Test config directory creation."""
         config_dir = temp_config_dir / "new_config"
@@ -68,6 +84,24 @@ class TestConfigManagerInitialization:
                 CLIConstants.CONFIG_DIR_PERMISSIONS
             )
 
+    def test_ensure_config_dir_runs_once_per_directory(self, config_manager):
+        """Test that an already prepared directory is not created or chmodded again."""
+        config_manager._ensure_config_dir()
+
+        with patch.object(Path, "mkdir") as mock_mkdir, \
+             patch("os.chmod") as mock_chmod:
+            config_manager._ensure_config_dir()
+
+        mock_mkdir.assert_not_called()
+        mock_chmod.assert_not_called()
+
+    def test_save_config_recreates_removed_directory(self, config_manager):
+        """Test that saving recreates a config directory removed after it was prepared."""
+        shutil.rmtree(config_manager.config_dir)
+
+        assert config_manager.save_config({"test_key": "test_value"}) is True
+        assert json.loads(config_manager.config_file.read_text()) == {"test_key": "test_value"}
+
     def test_ensure_config_dir_permissions_windows(self, config_manager):
         """Test config directory permissions on Windows (should skip chmod)."""
         with patch("os.name", SystemConstants.WINDOWS_PLATFORM), \
@@ -110,6 +144,42 @@ class TestConfigManagerLoadSave:
             result = config_manager.load_config()
             assert result == {}
 
+    def test_load_config_cached_until_file_changes(self, config_manager):
+        """Test that an unchanged config file is parsed only once."""
+        config_manager.config_file.write_text(json.dumps({"test_key": "test_value"}))
+
+        with patch("persistent_ssh_agent.cli.json.load", wraps=json.load) as mock_load:
+            first = config_manager.load_config()
+            first["test_key"] = "mutated"
+            assert config_manager.load_config() == {"test_key": "test_value"}
+            assert mock_load.call_count == 1
+
+            # Rewriting the file with a different size invalidates the cache
+            config_manager.config_file.write_text(json.dumps({"test_key": "other_value"}))
+            assert config_manager.load_config() == {"test_key": "other_value"}
+            assert mock_load.call_count == 2
+
+    def test_getters_read_cache_without_copying(self, config_manager):
+        """Test that getters read the cached configuration without deep-copying it."""
+        config_manager.save_config({"identity_file": "/path/to/key", "keys": {"work": "/path/to/work"}})
+
+        with patch("persistent_ssh_agent.cli.copy.deepcopy") as mock_deepcopy:
+            assert config_manager.get_identity_file() == "/path/to/key"
+            assert config_manager.list_keys() == {"default": "/path/to/key", "work": "/path/to/work"}
+            mock_deepcopy.assert_not_called()
+
+        # Modifying a loaded copy must not leak into what the getters see
+        config_manager.load_config()["identity_file"] = "/mutated"
+        assert config_manager.get_identity_file() == "/path/to/key"
+
+    def test_save_config_writes_through_cache(self, config_manager):
+        """Test that saving updates the cache so the next load skips parsing."""
+        config_manager.save_config({"test_key": "test_value"})
+
+        with patch("persistent_ssh_agent.cli.json.load") as mock_load:
+            assert config_manager.load_config() == {"test_key": "test_value"}
+            mock_load.assert_not_called()
+
     def test_save_config_success(self, config_manager):
         """Test successful config saving."""
         test_config = {"test_key": "test_value"}
@@ -123,38 +193,41 @@ class TestConfigManagerLoadSave:
         saved_config = json.loads(config_manager.config_file.read_text())
         assert saved_config == test_config
 
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX file modes are not available on Windows")
     def test_save_config_permissions_unix(self, config_manager):
         """Test config file permissions on Unix systems."""
-        with patch("os.name", "posix"), \
-             patch("os.chmod") as mock_chmod:
-            
+        with patch("os.chmod") as mock_chmod:
             test_config = {"test_key": "test_value"}
             config_manager.save_config(test_config)
-            
-            mock_chmod.assert_called_once_with(
-                config_manager.config_file,
-                CLIConstants.CONFIG_FILE_PERMISSIONS
-            )
 
-    def test_save_config_permissions_windows(self, config_manager):
-        """Test config file permissions on Windows (should skip chmod)."""
-        with patch("os.name", SystemConstants.WINDOWS_PLATFORM), \
-             patch("os.chmod") as mock_chmod:
-            
-            test_config = {"test_key": "test_value"}
-            config_manager.save_config(test_config)
-            
-            # chmod should not be called on Windows
+            # The file is created with its final mode, no separate chmod is needed
             mock_chmod.assert_not_called()
+            assert config_manager.config_file.stat().st_mode & 0o777 == CLIConstants.CONFIG_FILE_PERMISSIONS
+
+    def test_save_config_creates_file_with_private_mode(self, config_manager):
+        """Test that the config file is created with its private mode on every platform."""
+        with patch("os.open", side_effect=os.open) as mock_open:
+            assert config_manager.save_config({"test_key": "test_value"})
+
+        mock_open.assert_called_once()
+        assert mock_open.call_args[0][2] == CLIConstants.CONFIG_FILE_PERMISSIONS
 
     def test_save_config_io_error(self, config_manager):
         """Test config saving with IO error."""
-        with patch("builtins.open", mock_open()) as mock_file:
-            mock_file.side_effect = IOError("Permission denied")
-            
+        with patch("os.open", side_effect=IOError("Permission denied")):
             result = config_manager.save_config({"test": "value"})
             assert not result
 
+    def test_save_config_failure_keeps_previous_file(self, config_manager):
+        """Test that a failed save leaves the old configuration and no temporary file behind."""
+        config_manager.save_config({"test": "old"})
+
+        with patch("os.replace", side_effect=OSError("Disk full")):
+            assert not config_manager.save_config({"test": "new"})
+
+        assert json.loads(config_manager.config_file.read_text()) == {"test": "old"}
+        assert list(config_manager.config_dir.iterdir()) == [config_manager.config_file]
+
 
 class TestConfigManagerGetSetValues:
     """Test configuration value getting and setting."""
@@ -198,6 +271,124 @@ class TestConfigManagerGetSetValues:
         assert saved_config["existing_key"] == "new_value"
 
 
+class TestConfigManagerTransaction:
+    """Test batching configuration changes with transaction()."""
+
+    def test_transaction_saves_once(self, config_manager):
+        """Test that several setters inside a transaction write the file once."""
+        with patch.object(config_manager, "save_config", wraps=config_manager.save_config) as mock_save:
+            with config_manager.transaction():
+                config_manager.set_identity_file("/path/to/key")
+                config_manager.set_expiration_time(2)
+                config_manager.set_reuse_agent(False)
+                # Reads inside the transaction see the pending changes
+                assert config_manager.get_reuse_agent() is False
+
+        assert mock_save.call_count == 1
+        saved_config = json.loads(config_manager.config_file.read_text())
+        assert saved_config == {
+            "identity_file": "/path/to/key",
+            "expiration_time": 2 * CLIConstants.SECONDS_PER_HOUR,
+            "reuse_agent": False,
+        }
+
+    def test_transaction_batches_key_changes(self, config_manager):
+        """Test that key, import and clear operations also wait for the end of a transaction."""
+        with patch.object(config_manager, "save_config", wraps=config_manager.save_config) as mock_save:
+            with config_manager.transaction():
+                config_manager.add_key("work", "/path/to/work")
+                config_manager.add_key("home", "/path/to/home")
+                assert config_manager.remove_key("home")
+                config_manager.import_config({"reuse_agent": True})
+
+        assert mock_save.call_count == 1
+        assert config_manager.load_config() == {"keys": {"work": "/path/to/work"}, "reuse_agent": True}
+
+        with config_manager.transaction():
+            config_manager.clear_config()
+        assert config_manager.load_config() == {}
+
+    def test_transaction_without_changes_skips_save(self, config_manager):
+        """Test that a transaction which changes nothing does not rewrite the file."""
+        config_manager.save_config({"reuse_agent": True})
+
+        with patch.object(config_manager, "save_config") as mock_save:
+            with config_manager.transaction():
+                config_manager.set_reuse_agent(True)
+
+        mock_save.assert_not_called()
+
+    def test_nested_transaction_joins_outer(self, config_manager):
+        """Test that an inner transaction leaves the single save to the outer one."""
+        with patch.object(config_manager, "save_config", wraps=config_manager.save_config) as mock_save:
+            with config_manager.transaction() as outer:
+                for index in range(3):
+                    with config_manager.transaction() as inner:
+                        assert inner is outer
+                        config_manager.add_key(f"key{index}", f"/path/to/key{index}")
+                assert mock_save.call_count == 0
+
+        assert mock_save.call_count == 1
+        assert len(config_manager.list_keys()) == 3
+
+    def test_nested_transaction_error_discards_outer(self, config_manager):
+        """Test that an error in an inner transaction discards the whole outer one."""
+        with pytest.raises(RuntimeError):
+            with config_manager.transaction():
+                config_manager.set_reuse_agent(False)
+                with config_manager.transaction():
+                    raise RuntimeError("boom")
+
+        assert config_manager.load_config() == {}
+        assert config_manager._pending is None
+
+    def test_transaction_discards_changes_on_error(self, config_manager):
+        """Test that a failing transaction leaves the stored configuration untouched."""
+        config_manager.save_config({"reuse_agent": True})
+
+        with pytest.raises(RuntimeError):
+            with config_manager.transaction():
+                config_manager.set_reuse_agent(False)
+                raise RuntimeError("boom")
+
+        assert config_manager.load_config() == {"reuse_agent": True}
+        assert config_manager._pending is None
+
+    def test_transaction_save_failure(self, config_manager):
+        """Test that a failed save at the end of a transaction raises."""
+        with patch.object(config_manager, "save_config", return_value=False):
+            with pytest.raises(IOError):
+                with config_manager.transaction():
+                    config_manager.set_reuse_agent(True)
+
+
+class TestConfigManagerSnapshot:
+    """Test serving several reads from one load with snapshot()."""
+
+    def test_snapshot_loads_once(self, config_manager):
+        """Test that getters inside a snapshot share a single load."""
+        config_manager.save_config({"identity_file": "/path/to/key", "reuse_agent": True})
+
+        with patch.object(config_manager, "load_config", wraps=config_manager.load_config) as mock_load:
+            with config_manager.snapshot():
+                assert config_manager.get_identity_file() == "/path/to/key"
+                assert config_manager.get_reuse_agent() is True
+                assert config_manager.get_passphrase() is None
+
+        assert mock_load.call_count == 1
+        assert config_manager._snapshot is None
+
+    def test_snapshot_is_released_on_error(self, config_manager):
+        """Test that getters read the file again after a failing snapshot block."""
+        with pytest.raises(RuntimeError):
+            with config_manager.snapshot():
+                raise RuntimeError("boom")
+
+        config_manager.save_config({"reuse_agent": False})
+        assert config_manager._snapshot is None
+        assert config_manager.get_reuse_agent() is False
+
+
 class TestConfigManagerSpecificMethods:
     """Test specific configuration methods."""
 
@@ -356,55 +547,57 @@ class TestConfigManagerEncryption:
 
     def test_derive_key_from_system(self, config_manager):
         """Test system key derivation."""
-        key, salt = config_manager._derive_key_from_system()
+        key = config_manager._derive_key_from_system(b"s" * CLIConstants.SALT_SIZE)
 
         assert len(key) == CLIConstants.KEY_SIZE
-        assert len(salt) == CLIConstants.SALT_SIZE
         assert isinstance(key, bytes)
-        assert isinstance(salt, bytes)
 
-    def test_derive_key_consistency(self, config_manager):
-        """Test that key derivation is consistent."""
-        key1, salt1 = config_manager._derive_key_from_system()
-        key2, salt2 = config_manager._derive_key_from_system()
+    def test_derive_key_depends_on_salt(self, config_manager):
+        """Test that the same salt gives the same key and a different salt a different one."""
+        key1 = config_manager._derive_key_from_system(b"a" * CLIConstants.SALT_SIZE)
+        key2 = config_manager._derive_key_from_system(b"a" * CLIConstants.SALT_SIZE)
+        key3 = config_manager._derive_key_from_system(b"b" * CLIConstants.SALT_SIZE)
 
-        # Should be consistent for same system
         assert key1 == key2
-        assert salt1 == salt2
-
-    def test_get_username_methods(self, config_manager):
-        """Test different username retrieval methods."""
-        # Test with os.getlogin() working
-        with patch("os.getlogin", return_value="test_user"):
-            username = config_manager._get_username()
-            assert username == "test_user"
-
-        # Test with os.getlogin() failing, getpass.getuser() working
-        with patch("os.getlogin", side_effect=OSError), \
-             patch("getpass.getuser", return_value="getpass_user"):
-            username = config_manager._get_username()
-            assert username == "getpass_user"
-
-        # Test with both failing, using environment variables
-        with patch("os.getlogin", side_effect=OSError), \
-             patch("getpass.getuser", side_effect=Exception), \
-             patch.dict(os.environ, {SystemConstants.ENV_USER: "env_user"}):
-            username = config_manager._get_username()
-            assert username == "env_user"
-
-        # Test with USER not set, using USERNAME
-        with patch("os.getlogin", side_effect=OSError), \
-             patch("getpass.getuser", side_effect=Exception), \
-             patch.dict(os.environ, {SystemConstants.ENV_USERNAME: "username_user"}, clear=True):
-            username = config_manager._get_username()
-            assert username == "username_user"
-
-        # Test with all methods failing
-        with patch("os.getlogin", side_effect=OSError), \
-             patch("getpass.getuser", side_effect=Exception), \
-             patch.dict(os.environ, {}, clear=True):
-            username = config_manager._get_username()
-            assert username == SystemConstants.UNKNOWN_USER
+        assert key1 != key3
+
+    def test_derive_key_is_cached(self, config_manager):
+        """Test that decrypting the same stored passphrase derives the key only once."""
+        encrypted = config_manager._encrypt_passphrase("secret")
+        _derive_key.cache_clear()
+
+        config_manager.deobfuscate_passphrase(encrypted)
+        config_manager.deobfuscate_passphrase(encrypted)
+        ConfigManager().deobfuscate_passphrase(encrypted)
+
+        assert _derive_key.cache_info().misses == 1
+        assert _derive_key.cache_info().hits == 2
+
+    def test_get_machine_id_is_cached(self, config_manager):
+        """Test that the machine ID is read only once per process."""
+        with patch("os.path.exists", return_value=True), \
+             patch("builtins.open", mock_open(read_data="cached-machine-id\n")) as mock_file:
+            assert config_manager._get_machine_id() == "cached-machine-id"
+            assert config_manager._get_machine_id() == "cached-machine-id"
+
+        assert mock_file.call_count == 1
+        assert _read_machine_id.cache_info().hits == 1
+
+    def test_aead_cipher_is_cached(self, config_manager):
+        """Test that the AES-GCM cipher is built once per key."""
+        encrypted = config_manager._encrypt_passphrase("secret")
+        assert config_manager.deobfuscate_passphrase(encrypted) == "secret"
+
+        assert _aead_cipher.cache_info().misses == 1
+        assert _aead_cipher.cache_info().hits == 1
+
+    def test_home_dir_is_cached(self):
+        """Test that the home directory is resolved only once per process."""
+        with patch("pathlib.Path.home", return_value=Path("/home/cached-user")) as mock_home:
+            assert _home_dir() == Path("/home/cached-user")
+            assert _home_dir() == Path("/home/cached-user")
+
+        assert mock_home.call_count == 1
 
     def test_get_machine_id_linux(self, config_manager):
         """Test machine ID retrieval on Linux."""
@@ -469,30 +662,76 @@ class TestConfigManagerEncryption:
         with pytest.raises(Exception, match="Incorrect padding|Invalid base64|Key error"):
             config_manager.deobfuscate_passphrase("invalid_data")
 
-    def test_pad_unpad_data(self, config_manager):
-        """Test data padding and unpadding."""
+    def test_unpad_data(self, config_manager):
+        """Test PKCS7 unpadding."""
         test_data = b"Hello, World!"
+        padding_length = CLIConstants.AES_BLOCK_SIZE - len(test_data)
 
-        # Pad data
-        padded = config_manager._pad_data(test_data)
-        assert len(padded) % CLIConstants.AES_BLOCK_SIZE == 0
-        assert len(padded) >= len(test_data)
-
-        # Unpad data
-        unpadded = config_manager._unpad_data(padded)
+        unpadded = config_manager._unpad_data(test_data + bytes([padding_length]) * padding_length)
         assert unpadded == test_data
 
-    def test_pad_data_exact_block_size(self, config_manager):
-        """Test padding data that's exactly block size."""
-        # Create data that's exactly one block size
+    def test_unpad_data_full_block(self, config_manager):
+        """Test unpadding data that was exactly one block before padding."""
         test_data = b"A" * CLIConstants.AES_BLOCK_SIZE
-
-        padded = config_manager._pad_data(test_data)
-        # Should add another full block of padding
-        assert len(padded) == CLIConstants.AES_BLOCK_SIZE * 2
-
-        unpadded = config_manager._unpad_data(padded)
-        assert unpadded == test_data
+        padding = bytes([CLIConstants.AES_BLOCK_SIZE]) * CLIConstants.AES_BLOCK_SIZE
+
+        assert config_manager._unpad_data(test_data + padding) == test_data
+
+    def test_encrypt_uses_aes_gcm_layout(self, config_manager):
+        """Test that encrypted data is the format prefix and salt + nonce + ciphertext with tag."""
+        stored = config_manager._encrypt_passphrase("secret")
+        assert stored.startswith(CLIConstants.ENCRYPTION_FORMAT_PREFIX)
+        encrypted = base64.b64decode(stored[len(CLIConstants.ENCRYPTION_FORMAT_PREFIX) :])
+
+        # 16-byte GCM tag appended to the 6-byte ciphertext
+        assert len(encrypted) == CLIConstants.SALT_SIZE + CLIConstants.GCM_NONCE_SIZE + len("secret") + 16
+
+    def test_encrypt_uses_fresh_salt(self, config_manager):
+        """Test that every encryption draws a new salt and still round-trips."""
+        first = config_manager._encrypt_passphrase("secret")
+        second = config_manager._encrypt_passphrase("secret")
+
+        prefix_length = len(CLIConstants.ENCRYPTION_FORMAT_PREFIX)
+        first_salt = base64.b64decode(first[prefix_length:])[: CLIConstants.SALT_SIZE]
+        second_salt = base64.b64decode(second[prefix_length:])[: CLIConstants.SALT_SIZE]
+        assert first_salt != second_salt
+        assert config_manager.deobfuscate_passphrase(first) == "secret"
+        assert config_manager.deobfuscate_passphrase(second) == "secret"
+
+    def test_decrypt_legacy_cbc_passphrase(self, config_manager):
+        """Test that passphrases stored in the legacy AES-CBC format still decrypt."""
+        salt = os.urandom(CLIConstants.SALT_SIZE)
+        key = config_manager._derive_key_from_system(salt)
+        iv = os.urandom(CLIConstants.IV_SIZE)
+        plaintext = b"legacy_secret"
+        padding_length = CLIConstants.AES_BLOCK_SIZE - len(plaintext) % CLIConstants.AES_BLOCK_SIZE
+        encryptor = Cipher(AES(key), CBC(iv)).encryptor()
+        ciphertext = encryptor.update(plaintext + bytes([padding_length]) * padding_length) + encryptor.finalize()
+
+        legacy = base64.b64encode(salt + iv + ciphertext).decode()
+        assert config_manager.deobfuscate_passphrase(legacy) == "legacy_secret"
+
+    def test_decrypt_with_wrong_key_raises(self, config_manager):
+        """Test that an AES-GCM passphrase never decrypts to a value under the wrong key."""
+        encrypted = config_manager._encrypt_passphrase("secret")
+
+        with patch.object(config_manager, "_derive_key_from_system", return_value=b"0" * CLIConstants.KEY_SIZE):
+            with pytest.raises(InvalidTag):
+                config_manager.deobfuscate_passphrase(encrypted)
+
+    def test_decrypt_tampered_passphrase_raises(self, config_manager):
+        """Test that flipping a ciphertext byte is detected instead of falling back to CBC."""
+        prefix = CLIConstants.ENCRYPTION_FORMAT_PREFIX
+        data = bytearray(base64.b64decode(config_manager._encrypt_passphrase("secret")[len(prefix) :]))
+        data[-1] ^= 0x01
+
+        with pytest.raises(InvalidTag):
+            config_manager.deobfuscate_passphrase(prefix + base64.b64encode(bytes(data)).decode())
+
+    def test_unpad_data_rejects_invalid_padding(self, config_manager):
+        """Test that malformed PKCS7 padding raises instead of truncating the data."""
+        with pytest.raises(ValueError):
+            config_manager._unpad_data(b"A" * 15 + b"\x05")
 
 
 class TestConfigManagerExportImport:
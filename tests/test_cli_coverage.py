@@ -2,7 +2,6 @@
 
 # Import built-in modules
 import json
-import os
 import sys
 from unittest.mock import MagicMock
 from unittest.mock import patch
@@ -36,7 +35,7 @@ def test_config_manager_ensure_config_dir():
                 mock_chmod.assert_called_once_with(manager.config_dir, 0o700)
 
         # Test with Windows OS
-        manager.config_dir.reset_mock()
+        manager.config_dir = MagicMock()
         with patch("persistent_ssh_agent.cli.os.name", "nt"):
             with patch("persistent_ssh_agent.cli.os.chmod") as mock_chmod:
                 manager._ensure_config_dir()
@@ -162,30 +161,23 @@ def test_config_manager_derive_key_from_system():
     """Test deriving key from system."""
     with patch.object(ConfigManager, "__init__", return_value=None):
         manager = ConfigManager()
+        salt = b"0123456789abcdef"
 
         # Test normal case
-        with patch("os.getlogin", return_value="test-user"):
-            with patch("socket.gethostname", return_value="test-hostname"):
-                with patch.object(manager, "_get_machine_id", return_value="test-machine-id"):
-                    with patch("pathlib.Path.home", return_value="/home/test-user"):
-                        key, salt = manager._derive_key_from_system()
-                        assert isinstance(key, bytes)
-                        assert isinstance(salt, bytes)
-                        assert len(key) == 32  # AES-256 key size
-                        assert len(salt) == 16  # Salt size
+        with patch("socket.gethostname", return_value="test-hostname"):
+            with patch.object(manager, "_get_machine_id", return_value="test-machine-id"):
+                with patch("pathlib.Path.home", return_value="/home/test-user"):
+                    key = manager._derive_key_from_system(salt)
+                    assert isinstance(key, bytes)
+                    assert len(key) == 32  # AES-256 key size
 
         # Test fallback case
-        with patch("os.getlogin", side_effect=OSError("Not available")):
-            with patch("getpass.getuser", side_effect=Exception("Not available")):
-                with patch.dict(os.environ, {"USER": ""}):
-                    with patch.dict(os.environ, {"USERNAME": ""}):
-                        with patch("socket.gethostname", side_effect=Exception("Not available")):
-                            with patch.object(manager, "_get_machine_id", side_effect=Exception("Not available")):
-                                with patch("persistent_ssh_agent.cli.logger") as mock_logger:
-                                    key, salt = manager._derive_key_from_system()
-                                    assert isinstance(key, bytes)
-                                    assert isinstance(salt, bytes)
-                                    mock_logger.warning.assert_called_once()
+        with patch("socket.gethostname", side_effect=Exception("Not available")):
+            with patch.object(manager, "_get_machine_id", side_effect=Exception("Not available")):
+                with patch("persistent_ssh_agent.cli.logger") as mock_logger:
+                    key = manager._derive_key_from_system(salt)
+                    assert isinstance(key, bytes)
+                    mock_logger.warning.assert_called_once()
 
 
 def test_config_manager_secure_delete_from_memory():
@@ -271,7 +263,7 @@ def test_run_ssh_connection_test_with_verbose():
             mock_config_manager.return_value = mock_manager
 
             # Create mock agent
-            with patch("persistent_ssh_agent.cli.PersistentSSHAgent") as mock_agent:
+            with patch("persistent_ssh_agent.core.PersistentSSHAgent") as mock_agent:
                 mock_agent_instance = MagicMock()
                 mock_agent_instance.setup_ssh.return_value = True
                 mock_agent.return_value = mock_agent_instance
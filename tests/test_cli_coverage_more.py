@@ -15,21 +15,21 @@ def test_config_manager_encrypt_decrypt():
     with patch.object(ConfigManager, "__init__", return_value=None):
         manager = ConfigManager()
 
-        # Mock _derive_key_from_system to return a fixed key and salt
+        # Mock _derive_key_from_system to return a fixed key
         with patch.object(manager, "_derive_key_from_system") as mock_derive:
             key = b"0123456789abcdef0123456789abcdef"  # 32 bytes for AES-256
             salt = b"0123456789abcdef"  # 16 bytes
-            mock_derive.return_value = (key, salt)
+            mock_derive.return_value = key
 
             # Test encrypt
             plaintext = "test-passphrase"
-            with patch("os.urandom", return_value=b"0123456789abcdef"):  # Mock IV
+            with patch("os.urandom", return_value=salt + b"0123456789ab"):  # Mock salt and nonce
                 encrypted = manager._encrypt_passphrase(plaintext)
                 assert encrypted != plaintext
                 assert isinstance(encrypted, str)
 
             # Test decrypt
-            with patch.object(manager, "_derive_key_from_system", return_value=(key, salt)):
+            with patch.object(manager, "_derive_key_from_system", return_value=key):
                 decrypted = manager.deobfuscate_passphrase(encrypted)
                 assert decrypted == plaintext
 
@@ -48,9 +48,9 @@ def test_config_manager_set_get_passphrase():
                     result = manager.set_passphrase("test-passphrase")
                     assert result is True
 
-            # Mock load_config to return config with passphrase
+            # Mock _read_config to return config with passphrase
             config = {"passphrase": "encrypted-passphrase"}
-            with patch.object(manager, "load_config", return_value=config):
+            with patch.object(manager, "_read_config", return_value=config):
                 # Test get_passphrase
                 result = manager.get_passphrase()
                 assert result == "encrypted-passphrase"
@@ -68,8 +68,8 @@ def test_config_manager_set_get_expiration_time():
                 result = manager.set_expiration_time(24)
                 assert result is True
 
-        # Mock load_config to return config with expiration_time
-        with patch.object(manager, "load_config", return_value={"expiration_time": 86400}):
+        # Mock _read_config to return config with expiration_time
+        with patch.object(manager, "_read_config", return_value={"expiration_time": 86400}):
             # Test get_expiration_time
             result = manager.get_expiration_time()
             assert result == 86400
@@ -87,8 +87,8 @@ def test_config_manager_set_get_reuse_agent():
                 result = manager.set_reuse_agent(True)
                 assert result is True
 
-        # Mock load_config to return config with reuse_agent
-        with patch.object(manager, "load_config", return_value={"reuse_agent": True}):
+        # Mock _read_config to return config with reuse_agent
+        with patch.object(manager, "_read_config", return_value={"reuse_agent": True}):
             # Test get_reuse_agent
             result = manager.get_reuse_agent()
             assert result is True
@@ -20,7 +20,7 @@ def runner():
 
 def test_git_debug_command(runner):
     """Test git-debug CLI command."""
-    with patch("persistent_ssh_agent.cli.PersistentSSHAgent") as mock_agent_class, patch(
+    with patch("persistent_ssh_agent.core.PersistentSSHAgent") as mock_agent_class, patch(
         "persistent_ssh_agent.cli.run_command"
     ) as mock_run_command:
         # Mock the SSH agent and its git methods
@@ -48,7 +48,7 @@ def test_git_debug_command(runner):
 
 def test_git_debug_command_no_helpers(runner):
     """Test git-debug CLI command with no credential helpers."""
-    with patch("persistent_ssh_agent.cli.PersistentSSHAgent") as mock_agent_class:
+    with patch("persistent_ssh_agent.core.PersistentSSHAgent") as mock_agent_class:
         # Mock the SSH agent and its git methods
         mock_agent = MagicMock()
         mock_agent_class.return_value = mock_agent
@@ -63,7 +63,7 @@ def test_git_debug_command_no_helpers(runner):
 
 def test_git_clear_command_with_helpers(runner):
     """Test git-clear CLI command with existing helpers."""
-    with patch("persistent_ssh_agent.cli.PersistentSSHAgent") as mock_agent_class:
+    with patch("persistent_ssh_agent.core.PersistentSSHAgent") as mock_agent_class:
         # Mock the SSH agent and its git methods
         mock_agent = MagicMock()
         mock_agent_class.return_value = mock_agent
@@ -83,7 +83,7 @@ def test_git_clear_command_with_helpers(runner):
 
 def test_git_clear_command_no_helpers(runner):
     """Test git-clear CLI command with no existing helpers."""
-    with patch("persistent_ssh_agent.cli.PersistentSSHAgent") as mock_agent_class:
+    with patch("persistent_ssh_agent.core.PersistentSSHAgent") as mock_agent_class:
         # Mock the SSH agent and its git methods
         mock_agent = MagicMock()
         mock_agent_class.return_value = mock_agent
@@ -97,7 +97,7 @@ def test_git_clear_command_no_helpers(runner):
 
 def test_git_clear_command_with_confirmation(runner):
     """Test git-clear CLI command with user confirmation."""
-    with patch("persistent_ssh_agent.cli.PersistentSSHAgent") as mock_agent_class:
+    with patch("persistent_ssh_agent.core.PersistentSSHAgent") as mock_agent_class:
         # Mock the SSH agent and its git methods
         mock_agent = MagicMock()
         mock_agent_class.return_value = mock_agent
@@ -115,7 +115,7 @@ def test_git_clear_command_with_confirmation(runner):
 
 def test_git_clear_command_user_cancels(runner):
     """Test git-clear CLI command when user cancels."""
-    with patch("persistent_ssh_agent.cli.PersistentSSHAgent") as mock_agent_class:
+    with patch("persistent_ssh_agent.core.PersistentSSHAgent") as mock_agent_class:
         # Mock the SSH agent and its git methods
         mock_agent = MagicMock()
         mock_agent_class.return_value = mock_agent
@@ -131,7 +131,7 @@ def test_git_clear_command_user_cancels(runner):
 
 def test_git_clear_command_failure(runner):
     """Test git-clear CLI command when clearing fails."""
-    with patch("persistent_ssh_agent.cli.PersistentSSHAgent") as mock_agent_class:
+    with patch("persistent_ssh_agent.core.PersistentSSHAgent") as mock_agent_class:
         # Mock the SSH agent and its git methods
         mock_agent = MagicMock()
         mock_agent_class.return_value = mock_agent
@@ -146,7 +146,7 @@ def test_git_clear_command_failure(runner):
 
 def test_git_setup_command_with_multiple_values_suggestion(runner):
     """Test git-setup command shows suggestion for multiple values error."""
-    with patch("persistent_ssh_agent.cli.PersistentSSHAgent") as mock_agent_class:
+    with patch("persistent_ssh_agent.core.PersistentSSHAgent") as mock_agent_class:
         # Mock the SSH agent and its git methods
         mock_agent = MagicMock()
         mock_agent_class.return_value = mock_agent
@@ -160,7 +160,7 @@ def test_git_setup_command_with_multiple_values_suggestion(runner):
 
 def test_git_debug_command_with_exception(runner):
     """Test git-debug CLI command when an exception occurs."""
-    with patch("persistent_ssh_agent.cli.PersistentSSHAgent") as mock_agent_class:
+    with patch("persistent_ssh_agent.core.PersistentSSHAgent") as mock_agent_class:
         # Mock the SSH agent to raise an exception
         mock_agent_class.side_effect = Exception("Test exception")
 
@@ -172,7 +172,7 @@ def test_git_debug_command_with_exception(runner):
 
 def test_git_clear_command_with_exception(runner):
     """Test git-clear CLI command when an exception occurs."""
-    with patch("persistent_ssh_agent.cli.PersistentSSHAgent") as mock_agent_class:
+    with patch("persistent_ssh_agent.core.PersistentSSHAgent") as mock_agent_class:
         # Mock the SSH agent to raise an exception
         mock_agent_class.side_effect = Exception("Test exception")
 
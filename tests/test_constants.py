@@ -150,8 +150,10 @@ class TestCLIConstants:
         assert CLIConstants.KEY_DERIVATION_ITERATIONS == 100000
         assert CLIConstants.SALT_SIZE == 16
         assert CLIConstants.IV_SIZE == 16
+        assert CLIConstants.GCM_NONCE_SIZE == 12
         assert CLIConstants.KEY_SIZE == 32
         assert CLIConstants.AES_BLOCK_SIZE == 16
+        assert CLIConstants.ENCRYPTION_FORMAT_PREFIX == "v2:"
 
     def test_time_conversion_constants(self):
         """Test time conversion constants."""
@@ -13,6 +13,7 @@ from unittest.mock import patch
 
 # Import third-party modules
 from persistent_ssh_agent.core import PersistentSSHAgent
+from persistent_ssh_agent.ssh_config_parser import _parsed_configs
 from persistent_ssh_agent.utils import extract_hostname
 from persistent_ssh_agent.utils import is_valid_hostname
 from persistent_ssh_agent.utils import run_command
@@ -658,12 +659,14 @@ def test_ssh_config_parsing_errors(ssh_manager):
         assert isinstance(config["test"]["identityfile"], list)
         assert "~/.ssh/test_key" in config["test"]["identityfile"]
 
-        # Test with invalid file content
+        # Test with invalid file content; the real file's stamp is unchanged, so drop the cached parse
+        _parsed_configs.clear()
         with patch("builtins.open", mock_open(read_data="Invalid Config")):
             config = ssh_manager._parse_ssh_config()
             assert config == {}
 
         # Test with file read error
+        _parsed_configs.clear()
         with patch("builtins.open", side_effect=IOError("File read error")):
             config = ssh_manager._parse_ssh_config()
             assert config == {}
@@ -1128,6 +1131,7 @@ def test_ssh_config_advanced_parsing(ssh_manager):
             assert config["test3"]["port"] == "2222"
 
             # Test Include directive
+            _parsed_configs.clear()
             mock_glob.return_value = ["/path/to/included.conf"]
             with patch(
                 "builtins.open",
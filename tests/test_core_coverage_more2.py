@@ -106,17 +106,15 @@ def test_add_ssh_key_with_passphrase_failure():
         with patch("os.path.expanduser", return_value="/home/user/.ssh/id_rsa"):
             # Mock _try_add_key_without_passphrase to return needs_passphrase
             with patch.object(agent, "_try_add_key_without_passphrase", return_value=(False, True)):
-                # Mock _has_cli to be True
-                with patch("persistent_ssh_agent.core._has_cli", True):
-                    # Mock getpass.getpass to return a passphrase
-                    with patch("getpass.getpass", return_value="passphrase"):
-                        # Mock _add_key_with_passphrase to return failure
-                        with patch.object(agent, "_add_key_with_passphrase", return_value=False):
-                            # Call _add_ssh_key
-                            result = agent._add_ssh_key("~/.ssh/id_rsa")
-
-                            # Verify the result
-                            assert result is False
+                # Mock getpass.getpass to return a passphrase
+                with patch("getpass.getpass", return_value="passphrase"):
+                    # Mock _add_key_with_passphrase to return failure
+                    with patch.object(agent, "_add_key_with_passphrase", return_value=False):
+                        # Call _add_ssh_key
+                        result = agent._add_ssh_key("~/.ssh/id_rsa")
+
+                        # Verify the result
+                        assert result is False
 
 
 def test_add_ssh_key_failure():
@@ -3,6 +3,8 @@
 # Import built-in modules
 import os
 from pathlib import Path
+import subprocess
+import sys
 from unittest.mock import patch
 
 # Import third-party modules
@@ -31,18 +33,25 @@ def mock_ssh_dir(tmp_path):
     return ssh_dir
 
 
-def test_get_identity_from_cli():
+def test_get_identity_from_cli(ssh_agent, mock_ssh_dir):
     """Test getting identity file from CLI configuration."""
-    # Skip this test for now - we'll focus on other tests to improve coverage
-    # The test is difficult to make work due to import complexities
-    pytest.skip("Skipping test_get_identity_from_cli due to import complexities")
+    identity_file = str(mock_ssh_dir / "id_rsa")
+    with patch("persistent_ssh_agent.cli.ConfigManager") as mock_manager:
+        mock_manager.return_value.get_identity_file.return_value = identity_file
+        assert ssh_agent._get_identity_from_cli() == identity_file
 
 
-def test_get_identity_from_cli_exception():
+def test_get_identity_from_cli_exception(ssh_agent):
     """Test getting identity file from CLI configuration with exception."""
-    # Skip this test for now - we'll focus on other tests to improve coverage
-    # The test is difficult to make work due to import complexities
-    pytest.skip("Skipping test_get_identity_from_cli_exception due to import complexities")
+    with patch("persistent_ssh_agent.cli.ConfigManager", side_effect=Exception("Config error")):
+        assert ssh_agent._get_identity_from_cli() is None
+
+
+def test_import_does_not_load_cli():
+    """Test that importing the library does not pull in the CLI and click."""
+    code = "import sys, persistent_ssh_agent; print('persistent_ssh_agent.cli' in sys.modules, 'click' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.split() == ["False", "False"]
 
 
 def test_get_identity_from_env(monkeypatch):
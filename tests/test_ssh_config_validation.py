@@ -1,11 +1,14 @@
 """Test SSH configuration validation."""
 
 # Import built-in modules
+import os
 from pathlib import Path
 import tempfile
+from unittest.mock import patch
 
 # Import third-party modules
 from persistent_ssh_agent.core import PersistentSSHAgent
+from persistent_ssh_agent.ssh_config_parser import _parsed_configs
 import pytest
 
 
@@ -28,6 +31,8 @@ def write_ssh_config(ssh_dir: Path, config_content: str):
     """Write SSH config content to a temporary file."""
     config_path = ssh_dir / "config"
     config_path.write_text(config_content)
+    # Same-size rewrites can land within one mtime tick, so drop the cached parse
+    _parsed_configs.clear()
 
 
 def test_connection_settings_validation(ssh_manager, temp_ssh_dir):
@@ -176,3 +181,55 @@ def test_invalid_config_format(ssh_manager, temp_ssh_dir):
     write_ssh_config(temp_ssh_dir, "Host test\n    InvalidKey value")
     config = ssh_manager._parse_ssh_config()
     assert "invalidkey" not in config.get("test", {})
+
+
+def test_parsed_config_is_cached(ssh_manager, temp_ssh_dir):
+    """Test that an unchanged config is served from the cache."""
+    write_ssh_config(temp_ssh_dir, "Host test\n    Port 22\n    IdentityFile ~/.ssh/id_rsa")
+    assert ssh_manager._parse_ssh_config()["test"]["port"] == "22"
+
+    with patch("builtins.open", side_effect=AssertionError("config re-read")):
+        config = ssh_manager._parse_ssh_config()
+    assert config["test"]["port"] == "22"
+
+    # Callers get their own copy, including multi-value options
+    config["test"]["port"] = "2222"
+    config["test"]["identityfile"].append("~/.ssh/other")
+    config = ssh_manager._parse_ssh_config()
+    assert config["test"]["port"] == "22"
+    assert config["test"]["identityfile"] == ["~/.ssh/id_rsa"]
+
+
+def test_parsed_config_cache_tracks_changes(ssh_manager, temp_ssh_dir):
+    """Test that changes to the config or an included file invalidate the cache."""
+    config_path = temp_ssh_dir / "config"
+    include_path = temp_ssh_dir / "extra.conf"
+    config_path.write_text(f"Include {include_path}\nHost test\n    Port 22")
+    include_path.write_text("Host extra\n    User git")
+    assert ssh_manager._parse_ssh_config()["extra"]["user"] == "git"
+
+    include_path.write_text("Host extra\n    User alice")
+    assert ssh_manager._parse_ssh_config()["extra"]["user"] == "alice"
+
+    config_path.write_text("Host test\n    Port 2222")
+    config = ssh_manager._parse_ssh_config()
+    assert config["test"]["port"] == "2222"
+    assert "extra" not in config
+
+
+def test_parsed_config_cache_tracks_wildcard_include_dirs(ssh_manager, temp_ssh_dir):
+    """Test that new files under a wildcard include directory invalidate the cache."""
+    conf_dir = temp_ssh_dir / "conf.d"
+    (conf_dir / "a").mkdir(parents=True)
+    (conf_dir / "a" / "config").write_text("Host a\n    User git")
+    write_ssh_config(temp_ssh_dir, "Include conf.d/*/config\nHost test\n    Port 22")
+    # Backdate the directories so the changes below always move their mtime
+    for path in (conf_dir, conf_dir / "a"):
+        os.utime(path, ns=(0, 0))
+    config = ssh_manager._parse_ssh_config()
+    assert config["a"]["user"] == "git"
+    assert "b" not in config
+
+    (conf_dir / "b").mkdir()
+    (conf_dir / "b" / "config").write_text("Host b\n    User alice")
+    assert ssh_manager._parse_ssh_config()["b"]["user"] == "alice"
@@ -413,15 +413,15 @@ class TestSSHKeyManagerGetCLIPassphrase:
         """Test successful CLI passphrase retrieval."""
         # Mock the import inside the method
         with patch("builtins.__import__") as mock_import:
-            mock_config_manager_class = MagicMock()
+            mock_get_config_manager = MagicMock()
             mock_manager = MagicMock()
             mock_manager.get_passphrase.return_value = "encrypted_passphrase"
             mock_manager.deobfuscate_passphrase.return_value = "decrypted_secret"
-            mock_config_manager_class.return_value = mock_manager
+            mock_get_config_manager.return_value = mock_manager
 
             # Mock the module import
             mock_cli_module = MagicMock()
-            mock_cli_module.ConfigManager = mock_config_manager_class
+            mock_cli_module.get_config_manager = mock_get_config_manager
 
             def import_side_effect(name, *args, **kwargs):
                 if name == "persistent_ssh_agent.cli":
@@ -443,13 +443,13 @@ class TestSSHKeyManagerGetCLIPassphrase:
     def test_get_cli_passphrase_no_stored_passphrase(self, ssh_key_manager):
         """Test CLI passphrase retrieval when no passphrase is stored."""
         with patch("builtins.__import__") as mock_import:
-            mock_config_manager_class = MagicMock()
+            mock_get_config_manager = MagicMock()
             mock_manager = MagicMock()
             mock_manager.get_passphrase.return_value = None
-            mock_config_manager_class.return_value = mock_manager
+            mock_get_config_manager.return_value = mock_manager
 
             mock_cli_module = MagicMock()
-            mock_cli_module.ConfigManager = mock_config_manager_class
+            mock_cli_module.get_config_manager = mock_get_config_manager
 
             def import_side_effect(name, *args, **kwargs):
                 if name == "persistent_ssh_agent.cli":
@@ -464,11 +464,11 @@ class TestSSHKeyManagerGetCLIPassphrase:
     def test_get_cli_passphrase_exception(self, ssh_key_manager):
         """Test CLI passphrase retrieval with exception."""
         with patch("builtins.__import__") as mock_import:
-            mock_config_manager_class = MagicMock()
-            mock_config_manager_class.side_effect = Exception("Config error")
+            mock_get_config_manager = MagicMock()
+            mock_get_config_manager.side_effect = Exception("Config error")
 
             mock_cli_module = MagicMock()
-            mock_cli_module.ConfigManager = mock_config_manager_class
+            mock_cli_module.get_config_manager = mock_get_config_manager
 
             def import_side_effect(name, *args, **kwargs):
                 if name == "persistent_ssh_agent.cli":